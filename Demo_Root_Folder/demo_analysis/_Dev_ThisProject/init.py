@@ -1,10 +1,22 @@
 import sys, os
+
+#Files objects from earlier calls (keyed by SetProjFiles arguments)
+dict_files = {}
+
 def SetProjFiles(proj_abbrev, root_folder, cwd_jupyter, IsTest=False, subdir_tests=''):
     """
     This demonstrates moving files instancing out of a 'dashboard' ipynb --to reduce clutter in
     a file potentially used by non-coders to run a model
     JDL updated 4/12/23
+
+    Repeat calls with the same arguments return the cached Files object without
+    touching sys.path or re-importing projfiles
     """
+    key = (proj_abbrev, root_folder, cwd_jupyter, IsTest, subdir_tests)
+    if key in dict_files:
+        dict_files[key].PrintLocations()
+        return dict_files[key]
+
     lsthome = cwd_jupyter.split(os.sep)
     idx_root = lsthome.index(root_folder) + 1
     dir_projfiles = os.sep.join(lsthome[0:idx_root] + [proj_abbrev + '_scripts', 'projfiles'])
@@ -12,4 +24,5 @@ def SetProjFiles(proj_abbrev, root_folder, cwd_jupyter, IsTest=False, subdir_tes
     import projfiles
     files = projfiles.Files(proj_abbrev, subdir_home=lsthome[-1], IsTest=IsTest, subdir_tests=subdir_tests)
     files.PrintLocations()
+    dict_files[key] = files
     return files
\ No newline at end of file
@@ -0,0 +1,157 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from roll2 import RollLength
+
+
+class AsyncIngest:
+    def __init__(self, lst_files, max_workers=4, IsProcessPool=False):
+        """
+        Concurrent ingest of many raw data workbooks with one roll per
+        sheet. Sheet listing and parsing run on a bounded pool; each roll's
+        table is yielded as soon as it is parsed so fitting can start while
+        later files are still being read
+
+        Usage (script): df = AsyncIngest(files).Run()
+        Usage (Jupyter, loop already running): df = await ingest.FitAll()
+
+        Args:
+        lst_files (list): Workbook (.xlsx/.xls) or .csv paths
+        max_workers (int, optional): Bound on concurrent parse jobs
+        IsProcessPool (Boolean, optional): Parse in processes instead of
+            threads (better for many small workbooks; more startup cost)
+        """
+        self.lst_files = list(lst_files)
+        self.max_workers = max_workers
+        self.IsProcessPool = IsProcessPool
+        self.df_results = None #One row of fit results per file and sheet
+
+    """
+    =========================================================================
+    Ingest - async generator of parsed sheets
+    =========================================================================
+    """
+    async def IterTables(self):
+        """
+        Yield dicts with file_raw, sheet, df_raw and error for every sheet
+        of every file, in completion order. Failures (unreadable file or
+        sheet) are yielded with df_raw None and an error string
+
+        Backpressure: a sheet parse starts only when one of 2 * max_workers
+        slots is free, and a slot frees when the consumer takes an item. So
+        if fitting is slower than parsing, at most that many parsed tables
+        wait in memory
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.max_workers)
+        slots = asyncio.Semaphore(2 * self.max_workers)
+        Executor = ProcessPoolExecutor if self.IsProcessPool else \
+            ThreadPoolExecutor
+
+        with Executor(max_workers=self.max_workers) as pool:
+            async def ReadSheet(file_raw, sheet):
+                await slots.acquire()
+                item = {'file_raw': file_raw, 'sheet': sheet,
+                        'df_raw': None, 'error': ''}
+                try:
+                    item['df_raw'] = await loop.run_in_executor(
+                        pool, self.ReadSheet, file_raw, sheet)
+                except Exception as e:
+                    item['error'] = f'{type(e).__name__}: {e}'
+                await queue.put(item)
+
+            async def ReadFile(file_raw):
+                try:
+                    sheets = await loop.run_in_executor(
+                        pool, self.SheetNames, file_raw)
+                except Exception as e:
+                    await slots.acquire()
+                    await queue.put({'file_raw': file_raw, 'sheet': None,
+                                     'df_raw': None,
+                                     'error': f'{type(e).__name__}: {e}'})
+                    return
+                await asyncio.gather(*(ReadSheet(file_raw, s)
+                                       for s in sheets))
+
+            async def ReadAll():
+                await asyncio.gather(*(ReadFile(f) for f in self.lst_files))
+                await queue.put(None)
+
+            task = asyncio.create_task(ReadAll())
+            try:
+                while (item := await queue.get()) is not None:
+                    slots.release()
+                    yield item
+            finally:
+                if not task.done(): task.cancel()
+
+    """
+    =========================================================================
+    FitAll Procedure
+    =========================================================================
+    """
+    async def FitAll(self):
+        """
+        Fit each sheet as soon as it is parsed; returns results DataFrame
+        sorted by file and sheet
+        """
+        import pandas as pd
+        results = []
+        async for item in self.IterTables():
+            results.append(self.FitTable(item))
+        cols = ['file_raw', 'sheet', 'n_rows', 'slope', 'intercept',
+                'R_squared', 'caliper', 'error']
+        df = pd.DataFrame(results, columns=cols)
+        self.df_results = df.sort_values(['file_raw', 'sheet'],
+                                         ignore_index=True)
+        return self.df_results
+
+    def Run(self):
+        """
+        Synchronous entry point for scripts (no running event loop)
+        """
+        return asyncio.run(self.FitAll())
+
+    @staticmethod
+    def FitTable(item):
+        """
+        Transform, fit and calculate caliper for one parsed sheet
+        """
+        result = {'file_raw': item['file_raw'], 'sheet': item['sheet'],
+                  'n_rows': 0, 'slope': float('nan'),
+                  'intercept': float('nan'), 'R_squared': float('nan'),
+                  'caliper': float('nan'), 'error': item['error']}
+        if item['df_raw'] is None: return result
+        try:
+            roll = RollLength()
+            roll.df_raw = item['df_raw']
+            roll.AddCalculatedRawCols()
+            roll.FitRawData()
+            roll.CalculateCaliper()
+            result.update(n_rows=len(roll.df_raw), slope=roll.slope,
+                          intercept=roll.intercept, R_squared=roll.R_squared,
+                          caliper=roll.caliper)
+        except Exception as e:
+            result['error'] = f'{type(e).__name__}: {e}'
+        return result
+
+    """
+    =========================================================================
+    Pool workers
+    =========================================================================
+    """
+    @staticmethod
+    def SheetNames(file_raw):
+        """
+        Sheet names of a workbook; a .csv is treated as one sheet (None)
+        """
+        if str(file_raw).lower().endswith('.csv'): return [None]
+        import pandas as pd
+        with pd.ExcelFile(file_raw) as xls: return list(xls.sheet_names)
+
+    @staticmethod
+    def ReadSheet(file_raw, sheet):
+        import pandas as pd
+        if sheet is None: return pd.read_csv(file_raw)
+        return pd.read_excel(file_raw, sheet_name=sheet)
@@ -0,0 +1,106 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import functools, os
+from concurrent.futures import ProcessPoolExecutor
+from roll2 import RollLength
+
+#Raw data quality report columns added to results if IsValidate
+QUALITY_COLS = ['n_nan', 'n_non_positive', 'n_non_monotonic', 'n_duplicate',
+                'n_valid', 'IsValid']
+
+
+class BatchFitter:
+    def __init__(self, path_rawdata, extensions=('.xlsx', '.xls', '.csv', '.rlb'), 
+                 max_workers=None, IsValidate=False):
+        """
+        Run CaliperFromRawDataProcedure on every raw data file in a case
+        study's raw_data folder across a process pool
+
+        Args:
+        path_rawdata (string): Folder of length vs. diam raw data files
+            (typically Files.path_rawdata)
+        extensions (tuple, optional): File extensions treated as raw data
+        max_workers (int, optional): Worker processes; None uses all cores
+            and 1 fits in-process (no pool)
+        IsValidate (Boolean, optional): Check raw data, fit only valid rows
+            and add quality report columns (see rawcheck.py)
+        """
+        self.path_rawdata = path_rawdata
+        self.extensions = tuple(e.lower() for e in extensions)
+        self.max_workers = max_workers
+        self.IsValidate = IsValidate
+        self.lst_files = [] #Raw data files found in path_rawdata
+        self.df_results = None #One row of fit results per file
+
+    @classmethod
+    def FromFiles(cls, files, **kwargs):
+        """
+        Instance from a projfiles.Files object's raw_data path
+        """
+        return cls(files.path_rawdata, **kwargs)
+
+    """
+    =========================================================================
+    FitAll Procedure
+    =========================================================================
+    """
+    def FitAll(self):
+        """
+        Find raw files, fit them in parallel and tabulate results with
+        one row per file. Failed files get an error message and NaN fits
+        """
+        import pandas as pd
+        self.FindRawFiles()
+        FitFile = functools.partial(self.FitFile, IsValidate=self.IsValidate)
+        if self.max_workers == 1:
+            results = [FitFile(f) for f in self.lst_files]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(FitFile, self.lst_files, 
+                                        chunksize=self.ChunkSize()))
+        cols = ['file_raw', 'n_rows', 'slope', 'intercept', 'R_squared', 
+                'caliper', 'error']
+        if self.IsValidate: cols[-1:-1] = QUALITY_COLS
+        self.df_results = pd.DataFrame(results, columns=cols)
+        return self.df_results
+
+    def FindRawFiles(self):
+        """
+        List raw data files (sorted) in path_rawdata; skips Excel lock files
+        """
+        self.lst_files = sorted(e.path for e in os.scandir(self.path_rawdata)
+                                if e.is_file() and not e.name.startswith('~$')
+                                and e.name.lower().endswith(self.extensions))
+        return self.lst_files
+
+    @staticmethod
+    def FitFile(file_raw, IsValidate=False):
+        """
+        Worker: read, transform, fit and calculate caliper for one file.
+        Exceptions are returned as an error string so one bad file does 
+        not stop the batch. IsValidate adds the raw data quality report
+        """
+        result = {'file_raw': file_raw, 'n_rows': 0, 'slope': float('nan'), 
+                  'intercept': float('nan'), 'R_squared': float('nan'), 
+                  'caliper': float('nan'), 'error': ''}
+        roll = RollLength(file_raw=file_raw)
+        try:
+            roll.CaliperFromRawDataProcedure(validate=IsValidate)
+            result.update(n_rows=len(roll.RawColumn('length')), slope=roll.slope, 
+                          intercept=roll.intercept, 
+                          R_squared=roll.R_squared, caliper=roll.caliper)
+        except Exception as e:
+            result['error'] = f'{type(e).__name__}: {e}'
+
+        #Quality n_rows counts all rows in the file, before cleaning
+        if IsValidate and roll.raw_quality is not None:
+            result.update(roll.raw_quality)
+        return result
+
+    def ChunkSize(self):
+        """
+        Files per task -- about 4 tasks per worker to balance load while
+        limiting inter-process overhead
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        return max(1, len(self.lst_files) // (4 * workers))
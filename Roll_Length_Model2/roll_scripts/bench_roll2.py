@@ -0,0 +1,209 @@
+#Version 10/17/26
+"""
+Benchmark suite for RollLength ingest, fit and length calculation
+
+Run from roll_scripts:
+  python bench_roll2.py --out bench_new.json
+  python bench_roll2.py --out bench_new.json --baseline bench_base.json
+
+Times (best of --repeat) and peak traced memory are recorded per step and
+size and saved as JSON. With --baseline, steps whose time or peak memory
+exceeds the baseline by more than --tolerance are listed and the exit code
+is 1
+"""
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import argparse, json, os, platform, subprocess, sys, tempfile, time
+import tracemalloc
+import numpy as np
+from roll2 import RollLength
+
+#Largest ingest size written as .xlsx (writing bigger workbooks is slow
+#and they near Excel's 1,048,576-row sheet limit); larger sizes use CSV
+MAX_XLSX_BENCH_ROWS = 100000
+
+
+class BenchmarkSuite:
+    def __init__(self, sizes=(10**3, 10**4, 10**5, 10**6, 10**7), repeat=3,
+                 path_work=None):
+        """
+        Args:
+        sizes (tuple, optional): Row counts (raw data) and roll counts
+            (length calculation) to benchmark
+        repeat (int, optional): Timing repeats per step; best time is kept
+        path_work (string, optional): Folder for generated raw data files
+            (default is a temporary directory)
+        """
+        self.sizes = sizes
+        self.repeat = repeat
+        self.path_work = path_work
+        self.results = [] #One dict per (step, n)
+
+    """
+    =========================================================================
+    RunAll Procedure
+    =========================================================================
+    """
+    def RunAll(self):
+        """
+        Benchmark every step at every size
+        """
+        with tempfile.TemporaryDirectory() as path_tmp:
+            path_work = self.path_work or path_tmp
+            for n in self.sizes:
+                file_raw = self.WriteRawData(path_work, n)
+                self.BenchRawDataSteps(file_raw, n)
+                self.BenchCalculateLength(n)
+        return self.results
+
+    def BenchRawDataSteps(self, file_raw, n):
+        """
+        ReadRawData, AddCalculatedRawCols, FitRawData and the full
+        CaliperFromRawDataProcedure on an n-row raw data file
+        """
+        roll = RollLength(file_raw=file_raw)
+        self.TimeStep('ReadRawData', n, roll.ReadRawData)
+        df_raw = roll.df_raw
+
+        def ResetCols():
+            roll.df_raw = df_raw[['length', 'diameter']].copy()
+        self.TimeStep('AddCalculatedRawCols', n, roll.AddCalculatedRawCols,
+                      setup=ResetCols)
+        self.TimeStep('FitRawData', n, roll.FitRawData)
+        self.TimeStep('CaliperFromRawDataProcedure', n,
+                      roll.CaliperFromRawDataProcedure)
+
+    def BenchCalculateLength(self, n):
+        """
+        Vectorized length for n rolls
+        """
+        rng = np.random.default_rng(0)
+        diam_roll = rng.uniform(80., 200., n)
+        diam_core = rng.uniform(30., 50., n)
+        caliper = rng.uniform(0.1, 1., n)
+        self.TimeStep('CalculateLength', n,
+                      lambda: RollLength.CalculateLengthArray(diam_roll,
+                                                              diam_core,
+                                                              caliper))
+
+    def TimeStep(self, step, n, func, setup=None):
+        """
+        Record best-of-repeat wall time and peak traced memory for func().
+        setup() (e.g. restoring inputs func modifies) runs before each call,
+        outside the timed and traced region
+        """
+        times = []
+        for _ in range(self.repeat):
+            if setup is not None: setup()
+            t0 = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - t0)
+
+        #Separate traced run so tracemalloc overhead doesn't skew timing
+        if setup is not None: setup()
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        result = {'step': step, 'n': n, 'time_s': min(times),
+                  'peak_bytes': peak}
+        self.results.append(result)
+        return result
+
+    @staticmethod
+    def WriteRawData(path_work, n):
+        """
+        Write an n-row synthetic length [m] vs. diameter [mm] file
+        """
+        import pandas as pd
+        diameter = np.linspace(150., 45., n)
+        length = RollLength.CalculateLengthArray(diameter, 40., 0.5)
+        df = pd.DataFrame({'length': length, 'diameter': diameter})
+        if n <= MAX_XLSX_BENCH_ROWS:
+            pf = os.path.join(path_work, f'raw_{n}.xlsx')
+            if not os.path.isfile(pf): df.to_excel(pf, index=False)
+        else:
+            pf = os.path.join(path_work, f'raw_{n}.csv')
+            if not os.path.isfile(pf): df.to_csv(pf, index=False)
+        return pf
+
+    """
+    =========================================================================
+    JSON storage and baseline comparison
+    =========================================================================
+    """
+    def ToJSON(self, pf):
+        """
+        Save results with commit and environment info for later comparison
+        """
+        record = {'commit': self.GitCommit(), 'timestamp': time.time(),
+                  'python': platform.python_version(),
+                  'machine': platform.machine(), 'results': self.results}
+        with open(pf, 'w') as f: json.dump(record, f, indent=2)
+        return record
+
+    @staticmethod
+    def LoadJSON(pf):
+        with open(pf) as f: return json.load(f)
+
+    def CompareToBaseline(self, baseline, tolerance=0.25):
+        """
+        List steps whose time_s or peak_bytes exceeds the baseline value by
+        > tolerance (fraction). Metrics missing on either side are skipped
+
+        Returns: list of dicts with step, n, metric, value, baseline and 
+        ratio (one per regressed metric)
+        """
+        base = {(r['step'], r['n']): r for r in baseline['results']}
+        regressions = []
+        for r in self.results:
+            r_base = base.get((r['step'], r['n']), {})
+            for metric in ('time_s', 'peak_bytes'):
+                if metric not in r or not r_base.get(metric, 0) > 0: continue
+                ratio = r[metric] / r_base[metric]
+                if ratio > 1 + tolerance:
+                    regressions.append({'step': r['step'], 'n': r['n'],
+                                        'metric': metric, 'value': r[metric],
+                                        'baseline': r_base[metric], 
+                                        'ratio': ratio})
+        return regressions
+
+    @staticmethod
+    def GitCommit():
+        try:
+            return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                  capture_output=True, text=True,
+                                  cwd=os.path.dirname(os.path.abspath(__file__))
+                                  ).stdout.strip()
+        except OSError:
+            return ''
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10**3, 10**4, 10**5, 10**6, 10**7])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--out', default='bench_results.json')
+    parser.add_argument('--baseline', default=None)
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    suite = BenchmarkSuite(sizes=args.sizes, repeat=args.repeat)
+    for r in suite.RunAll():
+        print(f"{r['step']:<30}{r['n']:>10}{r['time_s']:>12.5f} s"
+              f"{r['peak_bytes'] / 2**20:>10.1f} MiB")
+    suite.ToJSON(args.out)
+
+    if args.baseline:
+        regressions = suite.CompareToBaseline(suite.LoadJSON(args.baseline),
+                                              args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['step']} n={r['n']} {r['metric']}: "
+                  f"{r['ratio']:.2f}x")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import os
+
+#Excel's row limit per worksheet (including the header row)
+MAX_EXCEL_ROWS = 1048576
+
+
+class ResultExporter:
+    def __init__(self, chunk_size=100000, sheet_name='results',
+                 max_sheet_rows=MAX_EXCEL_ROWS):
+        """
+        Constant-memory export of fit and length results to .xlsx, .csv or
+        .parquet. Data is written chunk by chunk, so memory is bounded by
+        chunk_size rather than by the number of rows
+
+        Excel uses openpyxl's write-only mode (rows are streamed to disk as
+        they are appended). Rows beyond one worksheet's limit continue on
+        numbered sheets (results, results_2, ...)
+
+        Usage: ResultExporter().Export(df_results, 'results.xlsx')
+
+        Args:
+        chunk_size (int, optional): Rows per chunk when splitting a DataFrame
+        sheet_name (string, optional): Name of the (first) Excel worksheet
+        max_sheet_rows (int, optional): Rows per worksheet including header
+        """
+        self.chunk_size = chunk_size
+        self.sheet_name = sheet_name
+        self.max_sheet_rows = max_sheet_rows
+
+    """
+    =========================================================================
+    Export Procedure
+    =========================================================================
+    """
+    def Export(self, data, pf_out):
+        """
+        Write data to pf_out, choosing the format from its extension.
+        data is a DataFrame or an iterable of DataFrame (or dict of arrays)
+        chunks, e.g. ResultStore.IterQuery or ParameterSweep.IterTiles.
+        Returns the number of data rows written
+        """
+        ext = os.path.splitext(pf_out)[1].lower()
+        dict_writers = {'.xlsx': self.ToExcel, '.csv': self.ToCsv,
+                        '.parquet': self.ToParquet}
+        if ext not in dict_writers:
+            raise ValueError(f"Unsupported export file type: {ext}")
+        return dict_writers[ext](self.Chunks(data), pf_out)
+
+    def Chunks(self, data):
+        """
+        Yield DataFrame chunks of at most chunk_size rows from data
+        """
+        import pandas as pd
+        if isinstance(data, pd.DataFrame): data = [data]
+        for chunk in data:
+            if not isinstance(chunk, pd.DataFrame):
+                chunk = pd.DataFrame(chunk)
+            for start in range(0, len(chunk), self.chunk_size):
+                yield chunk.iloc[start:start + self.chunk_size]
+
+    """
+    =========================================================================
+    Writers
+    =========================================================================
+    """
+    def ToExcel(self, chunks, pf_out):
+        from openpyxl import Workbook
+        wb = Workbook(write_only=True)
+        ws, header, n_rows, n_sheet_rows = None, None, 0, 0
+        for chunk in chunks:
+            if header is None: header = list(chunk.columns)
+
+            #Empty cells for missing values; Excel cannot open NaN cells
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            for row in chunk.itertuples(index=False, name=None):
+                if ws is None or n_sheet_rows == self.max_sheet_rows:
+                    ws = wb.create_sheet(self.SheetName(len(wb.worksheets)))
+                    ws.append(header)
+                    n_sheet_rows = 1
+                ws.append(row)
+                n_sheet_rows += 1
+                n_rows += 1
+        if ws is None: wb.create_sheet(self.sheet_name)
+        wb.save(pf_out)
+        return n_rows
+
+    def ToCsv(self, chunks, pf_out):
+        n_rows, header = 0, True
+        with open(pf_out, 'w', newline='') as f:
+            for chunk in chunks:
+                chunk.to_csv(f, header=header, index=False)
+                header = False
+                n_rows += len(chunk)
+        return n_rows
+
+    def ToParquet(self, chunks, pf_out):
+        """
+        Parquet row groups, one per chunk. Needs pyarrow (imported here)
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        n_rows, writer = 0, None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(pf_out, table.schema)
+                writer.write_table(table.cast(writer.schema))
+                n_rows += len(chunk)
+        finally:
+            if writer is not None: writer.close()
+        return n_rows
+
+    def SheetName(self, i):
+        return self.sheet_name if i == 0 else f'{self.sheet_name}_{i + 1}'
@@ -0,0 +1,307 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import numpy as np
+
+#Rows per block in LinearFitStats.Update; float64 temporaries are this size
+BLOCK_ROWS = 100000
+
+
+class LinearFitStats:
+    def __init__(self):
+        """
+        Closed-form, one-variable least squares fit (y = slope * x + intercept)
+        built from sufficient statistics instead of a regression object
+
+        Sums are accumulated relative to the first (x, y) point seen. The
+        shift leaves slope and R-squared unchanged and avoids cancellation
+        in the centered sums when x or y carries a large offset
+        """
+        #Sufficient statistics
+        self.n = 0 #Number of points accumulated
+        self.x0 = None #Shift applied to x before summing
+        self.y0 = None #Shift applied to y before summing
+        self.sum_x = 0. #Sum of (x - x0)
+        self.sum_y = 0. #Sum of (y - y0)
+        self.sum_xy = 0. #Sum of (x - x0) * (y - y0)
+        self.sum_xx = 0. #Sum of (x - x0) ** 2
+        self.sum_yy = 0. #Sum of (y - y0) ** 2
+
+        #Fit results
+        self.slope = None #Calculated slope from linear fit
+        self.intercept = None #Calculated y-intercept from linear fit
+        self.R_squared = None #Calculated R-Squared from linear fit
+
+    @classmethod
+    def FromArrays(cls, x, y):
+        """
+        Accumulate x and y arrays in one pass and calculate the fit
+        """
+        stats = cls()
+        stats.Update(x, y)
+        stats.CalculateFit()
+        return stats
+
+    def Update(self, x, y):
+        """
+        Add x, y points to the running sums. Non-finite points raise 
+        ValueError before any sum changes, so a bad chunk leaves the 
+        running fit intact
+
+        Points are summed in BLOCK_ROWS blocks, each upcast to float64, so
+        temporaries stay a fixed size however long (or narrow -- float32,
+        strided memmap views) x and y are
+        """
+        x, y = np.asarray(x), np.asarray(y)
+        if x.ndim != 1: x = x.reshape(-1)
+        if y.ndim != 1: y = y.reshape(-1)
+        if x.size != y.size:
+            raise ValueError("x and y must have the same number of points.")
+        if x.size == 0: return
+        for i in range(0, x.size, BLOCK_ROWS):
+            CheckFinite(x[i:i + BLOCK_ROWS], y[i:i + BLOCK_ROWS])
+
+        if self.x0 is None: self.x0, self.y0 = float(x[0]), float(y[0])
+        for i in range(0, x.size, BLOCK_ROWS):
+            dx = x[i:i + BLOCK_ROWS].astype(np.float64) - self.x0
+            dy = y[i:i + BLOCK_ROWS].astype(np.float64) - self.y0
+            self.n += dx.size
+            self.sum_x += dx.sum()
+            self.sum_y += dy.sum()
+            self.sum_xy += np.dot(dx, dy)
+            self.sum_xx += np.dot(dx, dx)
+            self.sum_yy += np.dot(dy, dy)
+
+    def Merge(self, other):
+        """
+        Combine another LinearFitStats' sums into this one (e.g. from 
+        separately accumulated chunks or workers) without revisiting data
+        """
+        if other.n == 0: return
+        if self.n == 0:
+            self.x0, self.y0 = other.x0, other.y0
+
+        #Re-express other's sums relative to this object's shift
+        dX, dY, n = other.x0 - self.x0, other.y0 - self.y0, other.n
+        self.sum_xy += (other.sum_xy + dY * other.sum_x + dX * other.sum_y + 
+                        n * dX * dY)
+        self.sum_xx += other.sum_xx + 2 * dX * other.sum_x + n * dX ** 2
+        self.sum_yy += other.sum_yy + 2 * dY * other.sum_y + n * dY ** 2
+        self.sum_x += other.sum_x + n * dX
+        self.sum_y += other.sum_y + n * dY
+        self.n += n
+
+    def CalculateFit(self):
+        """
+        Calculate slope, intercept and R-squared from the running sums
+        """
+        if self.n < 2:
+            raise ValueError("At least two points are needed to fit a line.")
+
+        Sxx = self.sum_xx - self.sum_x ** 2 / self.n
+        Syy = self.sum_yy - self.sum_y ** 2 / self.n
+        Sxy = self.sum_xy - self.sum_x * self.sum_y / self.n
+        if Sxx <= 0:
+            raise ValueError("x values have no spread; slope is undefined.")
+
+        self.slope = Sxy / Sxx
+        mean_x = self.x0 + self.sum_x / self.n
+        mean_y = self.y0 + self.sum_y / self.n
+        self.intercept = mean_y - self.slope * mean_x
+
+        #Constant y is a perfect (zero-slope) fit -- matches sklearn's score
+        self.R_squared = 1.0 if Syy <= 0 else min(Sxy ** 2 / (Sxx * Syy), 1.0)
+        return self.slope, self.intercept, self.R_squared
+
+
+class RobustLinearFit:
+    def __init__(self, n_pairs=100000, tune=4.685, max_iter=50, tol=1e-10,
+                 seed=0):
+        """
+        Outlier-resistant line fit for noisy measurements: sampled Theil-Sen
+        start followed by iteratively reweighted least squares with Tukey's
+        bisquare weights. Each iteration is one vectorized O(n) pass, so
+        cost is O(n) per iteration plus O(n_pairs) for the start
+
+        Args:
+        n_pairs (int, optional): Random point pairs for Theil-Sen slopes
+        tune (float, optional): Bisquare tuning constant (x robust sigma)
+        max_iter (int, optional): Maximum reweighting iterations
+        tol (float, optional): Relative slope change to stop iterating
+        seed (int, optional): Random seed for pair sampling
+        """
+        self.n_pairs = n_pairs
+        self.tune = tune
+        self.max_iter = max_iter
+        self.tol = tol
+        self.seed = seed
+
+        self.slope = None #Calculated slope from robust fit
+        self.intercept = None #Calculated y-intercept from robust fit
+        self.R_squared = None #Weighted R-squared of the robust fit
+        self.weights = None #Final bisquare weight per point (0 to 1)
+        self.outliers = None #Boolean mask of points given zero weight
+        self.n_iter = 0 #Reweighting iterations used
+
+    def Fit(self, x, y):
+        """
+        Fit y = slope * x + intercept; returns (slope, intercept, R_squared)
+        """
+        x = np.asarray(x, dtype=np.float64).ravel()
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if x.size < 2:
+            raise ValueError("At least two points are needed to fit a line.")
+        CheckFinite(x, y)
+
+        self.slope, self.intercept = self.TheilSen(x, y)
+        w = np.ones_like(y)
+        for self.n_iter in range(1, self.max_iter + 1):
+            w = self.BisquareWeights(y - (self.slope * x + self.intercept))
+            slope_prev = self.slope
+            self.slope, self.intercept = self.WeightedLeastSquares(x, y, w)
+            if abs(self.slope - slope_prev) <= self.tol * abs(slope_prev):
+                break
+
+        self.weights = self.BisquareWeights(y - (self.slope * x + 
+                                                 self.intercept))
+        self.outliers = self.weights == 0
+        self.R_squared = self.WeightedRSquared(x, y, self.weights)
+        return self.slope, self.intercept, self.R_squared
+
+    def TheilSen(self, x, y):
+        """
+        Median of slopes over (up to n_pairs) randomly sampled point pairs
+        and median intercept. Uses all pairs for small data
+        """
+        n = x.size
+        if n * (n - 1) // 2 <= self.n_pairs:
+            i, j = np.triu_indices(n, k=1)
+        else:
+            rng = np.random.default_rng(self.seed)
+            i = rng.integers(0, n, self.n_pairs)
+            j = rng.integers(0, n, self.n_pairs)
+        dx = x[j] - x[i]
+        ok = dx != 0
+        if not ok.any():
+            raise ValueError("x values have no spread; slope is undefined.")
+        slope = np.median((y[j] - y[i])[ok] / dx[ok])
+        return slope, np.median(y - slope * x)
+
+    def BisquareWeights(self, resid):
+        """
+        Tukey bisquare weights with scale from the median absolute deviation
+        """
+        scale = 1.4826 * np.median(np.abs(resid - np.median(resid)))
+        if scale == 0: return (resid == 0).astype(np.float64)
+        u = resid / (self.tune * scale)
+        return np.where(np.abs(u) < 1, (1 - u ** 2) ** 2, 0.)
+
+    @staticmethod
+    def WeightedLeastSquares(x, y, w):
+        sw = w.sum()
+        mean_x, mean_y = np.dot(w, x) / sw, np.dot(w, y) / sw
+        dx, dy = x - mean_x, y - mean_y
+        slope = np.dot(w * dx, dy) / np.dot(w * dx, dx)
+        return slope, mean_y - slope * mean_x
+
+    def WeightedRSquared(self, x, y, w):
+        sw = w.sum()
+        if sw == 0: return float('nan')
+        ss_res = np.dot(w, (y - (self.slope * x + self.intercept)) ** 2)
+        ss_tot = np.dot(w, (y - np.dot(w, y) / sw) ** 2)
+        return 1.0 if ss_tot == 0 else 1 - ss_res / ss_tot
+
+
+class BootstrapFit:
+    def __init__(self, n_boot=2000, ci=95, seed=0, max_bytes=64 * 2**20,
+                 max_workers=1):
+        """
+        Bootstrap confidence intervals for a least squares line fit
+
+        Resamples are drawn as multinomial count vectors and fit together as
+        weighted sums -- one matrix product per batch instead of a loop of
+        fits. Batches are sized so the count matrices (int64 draws plus their
+        float64 copy) stay under max_bytes
+        and each batch has its own seed spawned from seed, so results are
+        reproducible for any max_workers (for a given max_bytes)
+
+        Args:
+        n_boot (int, optional): Number of bootstrap resamples
+        ci (float, optional): Confidence level in percent
+        seed (int, optional): Root random seed
+        max_bytes (int, optional): Memory cap for one batch's count matrices
+        max_workers (int, optional): Processes for batches (1 = in-process)
+        """
+        self.n_boot = n_boot
+        self.ci = ci
+        self.seed = seed
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+
+        self.slopes = None #Slope of each resample
+        self.intercepts = None #Intercept of each resample
+
+    def Fit(self, x, y):
+        """
+        Fit all resamples; returns dict of (low, high) for slope, intercept
+        """
+        x = np.asarray(x, dtype=np.float64).ravel()
+        y = np.asarray(y, dtype=np.float64).ravel()
+        n = x.size
+        if n < 2:
+            raise ValueError("At least two points are needed to fit a line.")
+
+        #Centering keeps the weighted sums well conditioned
+        mean_x, mean_y = x.mean(), y.mean()
+        xc, yc = x - mean_x, y - mean_y
+        #16 bytes per count: multinomial's int64 plus the float64 for matmul
+        rows = max(1, self.max_bytes // (n * 16))
+        sizes = [min(rows, self.n_boot - i) for i in range(0, self.n_boot, rows)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        args = [(xc, yc, b, s) for b, s in zip(sizes, seeds)]
+
+        if self.max_workers == 1:
+            batches = [self.FitBatch(*a) for a in args]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                batches = list(pool.map(self.FitBatch, *zip(*args)))
+
+        slopes = np.concatenate([b[0] for b in batches])
+        self.slopes = slopes
+        self.intercepts = np.concatenate([b[1] for b in batches]) + \
+            mean_y - slopes * mean_x
+        return {'slope': self.Interval(self.slopes),
+                'intercept': self.Interval(self.intercepts)}
+
+    @staticmethod
+    def FitBatch(xc, yc, n_boot, seed_seq):
+        """
+        Worker: slopes and (centered) intercepts for n_boot resamples
+        """
+        n = xc.size
+        rng = np.random.default_rng(seed_seq)
+        W = rng.multinomial(n, np.full(n, 1 / n), size=n_boot).astype(np.float64)
+        sw_x, sw_y = W @ xc, W @ yc
+        Sxx = W @ (xc * xc) - sw_x ** 2 / n
+        Sxy = W @ (xc * yc) - sw_x * sw_y / n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slopes = Sxy / Sxx
+        return slopes, (sw_y - slopes * sw_x) / n
+
+    def Interval(self, values):
+        """
+        Percentile interval (low, high) at the ci level, ignoring NaNs from
+        degenerate resamples (all points at one x)
+        """
+        tail = (100 - self.ci) / 2
+        low, high = np.nanpercentile(values, [tail, 100 - tail])
+        return float(low), float(high)
+
+
+def CheckFinite(x, y):
+    """
+    Raise ValueError if x or y contains NaN or infinity (as sklearn does)
+    """
+    for name, values in (('x', x), ('y', y)):
+        if not np.isfinite(values).all():
+            raise ValueError(f"Input {name} contains NaN or infinity.")
@@ -0,0 +1,127 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import functools, json, threading, time, tracemalloc
+
+
+class StepRegistry:
+    def __init__(self):
+        """
+        Process-wide record of per-step timing and memory for instrumented
+        procedure methods (see Instrumented). Disabled by default; while
+        disabled, instrumented methods only pay one attribute check
+
+        Each record has step, wall_s, cpu_s, rows, alloc_bytes (net traced
+        allocation kept after the step) and peak_bytes (traced peak above the
+        starting level, including nested steps). Memory fields are None
+        unless Enable(trace_memory=True)
+
+        RollLength.CalculateLength is a memoized property: only refreshes
+        of its memo are recorded (as RollLength.CachedLengthLookup, whether
+        the process-wide LRU hits or misses); repeat reads are not
+        """
+        self.IsEnabled = False
+        self.IsTraceMemory = False
+        self.IsOwnTrace = False #True if Enable started tracemalloc
+        self.records = [] #One dict per instrumented call
+        self.lock = threading.Lock()
+        self.local = threading.local() #Per-thread stack of open steps
+
+    def Enable(self, trace_memory=True):
+        self.IsEnabled = True
+        self.IsTraceMemory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.IsOwnTrace = True
+
+    def Disable(self):
+        self.IsEnabled = False
+        self.IsTraceMemory = False
+        if self.IsOwnTrace: tracemalloc.stop()
+        self.IsOwnTrace = False
+
+    def Clear(self):
+        with self.lock: self.records = []
+
+    def Run(self, method, obj, args, kwargs):
+        """
+        Call method(obj, *args, **kwargs) and record its step metrics
+        """
+        stack = self.local.__dict__.setdefault('stack', [])
+        frame = {'peak': 0}
+        mem0 = 0
+        IsMem = self.IsTraceMemory and tracemalloc.is_tracing()
+        if IsMem:
+            mem0, peak0 = tracemalloc.get_traced_memory()
+            if stack: stack[-1]['peak'] = max(stack[-1]['peak'], peak0)
+            tracemalloc.reset_peak()
+        stack.append(frame)
+
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        try:
+            return method(obj, *args, **kwargs)
+        finally:
+            wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+            stack.pop()
+            alloc = peak = None
+            if IsMem:
+                mem1, peak1 = tracemalloc.get_traced_memory()
+                peak = max(peak1, frame['peak'])
+                alloc, peak = mem1 - mem0, peak - mem0
+                if stack: stack[-1]['peak'] = max(stack[-1]['peak'], peak1,
+                                                  frame['peak'])
+            record = {'step': f'{type(obj).__name__}.{method.__name__}',
+                      'wall_s': wall, 'cpu_s': cpu, 'rows': RowCount(obj),
+                      'alloc_bytes': alloc, 'peak_bytes': peak}
+            with self.lock: self.records.append(record)
+
+    """
+    =========================================================================
+    Export
+    =========================================================================
+    """
+    def Summary(self):
+        """
+        DataFrame with one row per step: calls, total/mean wall and cpu
+        time, total rows and max peak memory
+        """
+        import pandas as pd
+        cols = ['step', 'wall_s', 'cpu_s', 'rows', 'alloc_bytes', 'peak_bytes']
+        df = pd.DataFrame(self.records, columns=cols)
+        grp = df.groupby('step', sort=False)
+        return pd.DataFrame({'calls': grp.size(),
+                             'wall_s': grp['wall_s'].sum(),
+                             'wall_mean_s': grp['wall_s'].mean(),
+                             'cpu_s': grp['cpu_s'].sum(),
+                             'rows': grp['rows'].sum(),
+                             'peak_bytes': grp['peak_bytes'].max()})
+
+    def ToJSON(self, pf):
+        with self.lock: records = list(self.records)
+        with open(pf, 'w') as f: json.dump(records, f, indent=2)
+
+
+#Process-wide registry used by Instrumented methods
+registry = StepRegistry()
+
+def Instrumented(method):
+    """
+    Decorator for procedure methods -- records metrics in registry when
+    enabled, otherwise calls straight through
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not registry.IsEnabled: return method(self, *args, **kwargs)
+        return registry.Run(method, self, args, kwargs)
+    return wrapper
+
+def RowCount(obj):
+    """
+    Rows processed by a step: raw data rows if loaded, else streamed rows
+    """
+    df_raw = getattr(obj, 'df_raw', None)
+    if df_raw is not None: return len(df_raw)
+    raw_mmap = getattr(obj, 'raw_mmap', None)
+    if raw_mmap is not None: return len(raw_mmap)
+    fit_stats = getattr(obj, 'fit_stats', None)
+    if fit_stats is not None: return fit_stats.n
+    return 1
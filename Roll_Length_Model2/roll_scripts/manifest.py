@@ -0,0 +1,113 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import json, os
+from concurrent.futures import ThreadPoolExecutor
+from projfiles import FileIndex
+from rawcache import RawDataCache
+
+
+class Manifest:
+    def __init__(self, roots, pf_manifest, max_workers=None):
+        """
+        Content-hash manifest of project data files for change detection.
+        Update() compares the current files with the stored manifest and
+        reports added, changed and removed files so downstream fitting and
+        plotting can process only what changed
+
+        Files whose size and mtime match the stored record keep their hash;
+        others are hashed (BLAKE2b) on a thread pool -- hashlib releases the
+        GIL, so large trees hash in parallel
+
+        Args:
+        roots (list): Folders to include (e.g. path_data, raw_data folders)
+        pf_manifest (string): JSON manifest path; keys are file paths
+            relative to the manifest's folder
+        max_workers (int, optional): Hashing threads; None uses the
+            ThreadPoolExecutor default
+        """
+        self.roots = [r for r in roots if os.path.isdir(r)]
+        self.pf_manifest = pf_manifest
+        self.path_base = os.path.dirname(os.path.abspath(pf_manifest))
+        self.max_workers = max_workers
+        self.records = {} #Relative path -> {'size', 'mtime', 'hash'}
+        self.changes = {'added': [], 'changed': [], 'removed': []}
+
+    @classmethod
+    def FromFiles(cls, files, **kwargs):
+        """
+        Manifest of path_data and every case study's raw_data folder,
+        stored as manifest.json in the project root
+        """
+        roots = [files.path_data]
+        if os.path.isdir(files.path_case_studies):
+            roots += [os.path.join(e.path, 'raw_data')
+                      for e in os.scandir(files.path_case_studies)
+                      if e.is_dir()]
+        return cls(roots, files.path_root + 'manifest.json', **kwargs)
+
+    """
+    =========================================================================
+    Update Procedure
+    =========================================================================
+    """
+    def Update(self, IsSave=True):
+        """
+        Scan roots, hash new or modified files and set changes. Returns
+        changes dict of absolute paths (lists are sorted)
+        """
+        old = self.Load()
+        index = FileIndex(self.roots)
+        current, to_hash = {}, []
+
+        #The manifest (and its temp file) may sit inside an indexed root
+        own = {os.path.abspath(p) for p in (self.pf_manifest,
+                                            self.pf_manifest + '.tmp')}
+        for path, size, mtime in index.entries:
+            if os.path.abspath(path) in own: continue
+            rel = os.path.relpath(path, self.path_base)
+            rec = old.get(rel)
+            if rec is not None and (rec['size'], rec['mtime']) == (size, mtime):
+                current[rel] = rec
+            else:
+                current[rel] = {'size': size, 'mtime': mtime, 'hash': None}
+                to_hash.append(rel)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            hashes = pool.map(RawDataCache.ContentHash,
+                              [self.AbsPath(r) for r in to_hash])
+            for rel, h in zip(to_hash, hashes): current[rel]['hash'] = h
+
+        self.changes = {
+            'added': [r for r in current if r not in old],
+            'changed': [r for r in current
+                        if r in old and current[r]['hash'] != old[r]['hash']],
+            'removed': [r for r in old if r not in current]}
+        self.changes = {k: sorted(self.AbsPath(r) for r in v)
+                        for k, v in self.changes.items()}
+        self.records = current
+        if IsSave: self.Save()
+        return self.changes
+
+    def ChangedFiles(self):
+        """
+        Files to (re)process after Update: added plus changed
+        """
+        return sorted(self.changes['added'] + self.changes['changed'])
+
+    """
+    =========================================================================
+    Storage utilities
+    =========================================================================
+    """
+    def Load(self):
+        if not os.path.isfile(self.pf_manifest): return {}
+        with open(self.pf_manifest) as f: return json.load(f)
+
+    def Save(self):
+        pf_tmp = self.pf_manifest + '.tmp'
+        with open(pf_tmp, 'w') as f:
+            json.dump(self.records, f, indent=1, sort_keys=True)
+        os.replace(pf_tmp, self.pf_manifest)
+
+    def AbsPath(self, rel):
+        return os.path.normpath(os.path.join(self.path_base, rel))
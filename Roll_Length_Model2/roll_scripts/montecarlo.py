@@ -0,0 +1,139 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from roll2 import RollLength
+
+
+class LengthMonteCarlo:
+    def __init__(self, diam_roll, diam_core, caliper, n_samples=10**6,
+                 chunk_size=10**5, seed=0, max_workers=1):
+        """
+        Monte Carlo propagation of diameter and caliper spread to roll length
+
+        Inputs are sampled in chunks and evaluated with the vectorized
+        RollLength.CalculateLengthArray. Lengths come back rounded to 0.1 m,
+        so each chunk reduces to exact counts per 0.1 m value; memory stays
+        bounded by chunk_size however many samples are drawn, and the
+        percentiles are exact
+
+        Each chunk has its own seed spawned from seed (SeedSequence), so
+        results are reproducible and identical for any max_workers
+
+        Args:
+        diam_roll, diam_core, caliper: Input in mm -- a float (fixed) or a
+            distribution tuple ('normal', mean, sd), ('uniform', low, high),
+            ('lognormal', mean, sd) or ('triangular', left, mode, right).
+            lognormal mean and sd are of the input in mm (not of its log)
+        n_samples (int, optional): Total samples
+        chunk_size (int, optional): Samples evaluated per vectorized chunk
+        seed (int, optional): Root random seed
+        max_workers (int, optional): Processes for chunks (1 = in-process)
+        """
+        self.inputs = {'diam_roll': diam_roll, 'diam_core': diam_core,
+                       'caliper': caliper}
+        self.n_samples = n_samples
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.max_workers = max_workers
+
+        self.values = None #Distinct lengths [m] (0.1 m resolution)
+        self.counts = None #Sample count for each value
+        self.n_invalid = 0 #Samples with non-finite or non-positive length
+
+    """
+    =========================================================================
+    Run Procedure
+    =========================================================================
+    """
+    def Run(self):
+        """
+        Draw all samples chunk by chunk and accumulate length counts
+        """
+        sizes = [self.chunk_size] * (self.n_samples // self.chunk_size)
+        if self.n_samples % self.chunk_size:
+            sizes.append(self.n_samples % self.chunk_size)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        args = [(self.inputs, n, s) for n, s in zip(sizes, seeds)]
+
+        if self.max_workers == 1:
+            chunks = [self.RunChunk(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                chunks = list(pool.map(self.RunChunk, *zip(*args)))
+
+        totals = {}
+        self.n_invalid = 0
+        for decims, counts, n_invalid in chunks:
+            self.n_invalid += n_invalid
+            for d, c in zip(decims.tolist(), counts.tolist()):
+                totals[d] = totals.get(d, 0) + c
+        keys = np.array(sorted(totals), dtype=np.int64)
+        self.values = keys / 10
+        self.counts = np.array([totals[k] for k in keys.tolist()],
+                               dtype=np.int64)
+        return self
+
+    @staticmethod
+    def RunChunk(inputs, n, seed_seq):
+        """
+        Worker: sample n inputs, calculate lengths and return exact counts
+        of lengths in 0.1 m units plus the number of invalid samples
+        """
+        rng = np.random.default_rng(seed_seq)
+        samples = {k: Sample(rng, spec, n) for k, spec in inputs.items()}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            length = RollLength.CalculateLengthArray(**samples)
+        length = np.broadcast_to(length, (n,))
+        ok = np.isfinite(length) & (length > 0)
+        decims, counts = np.unique(np.rint(length[ok] * 10).astype(np.int64),
+                                   return_counts=True)
+        return decims, counts, int(n - ok.sum())
+
+    """
+    =========================================================================
+    Results
+    =========================================================================
+    """
+    def Percentiles(self, q=(1, 5, 50, 95, 99)):
+        """
+        Dict of percentile -> length [m] (inverted CDF; exact)
+        """
+        cum = np.cumsum(self.counts)
+        ranks = np.ceil(np.asarray(q, dtype=float) / 100 * cum[-1])
+        idx = np.searchsorted(cum, np.maximum(ranks, 1))
+        return dict(zip(q, self.values[idx].tolist()))
+
+    def Summary(self):
+        """
+        Sample count, invalid count, mean and standard deviation [m]
+        """
+        n = self.counts.sum()
+        mean = np.dot(self.values, self.counts) / n
+        var = np.dot((self.values - mean) ** 2, self.counts) / n
+        return {'n': int(n), 'n_invalid': self.n_invalid, 'mean': mean,
+                'std': np.sqrt(var)}
+
+    def Histogram(self, bins=50):
+        """
+        (counts, bin_edges) of lengths over bins equal-width bins
+        """
+        return np.histogram(self.values, bins=bins, weights=self.counts)
+
+
+def Sample(rng, spec, n):
+    """
+    n samples for a fixed value or a distribution tuple (see
+    LengthMonteCarlo); fixed values broadcast without allocating n values
+    """
+    if np.isscalar(spec): return spec
+    name, *params = spec
+    if name not in ('normal', 'uniform', 'lognormal', 'triangular'):
+        raise ValueError(f"Unsupported distribution: {name}")
+
+    #numpy's lognormal takes the mean and sigma of the underlying normal
+    if name == 'lognormal':
+        mean, sd = params
+        sigma2 = np.log1p((sd / mean) ** 2)
+        params = [np.log(mean) - sigma2 / 2, np.sqrt(sigma2)]
+    return getattr(rng, name)(*params, size=n)
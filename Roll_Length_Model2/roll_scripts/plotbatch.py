@@ -0,0 +1,143 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import json, os
+from concurrent.futures import ProcessPoolExecutor
+from batchfit import BatchFitter
+from rawcache import RawDataCache
+from roll2 import RollLength
+
+
+class PlotRenderer:
+    def __init__(self, path_rawdata, path_plots, fmt='png', mode='auto',
+                 max_workers=None):
+        """
+        Headless rendering of raw and transformed data plots for every raw
+        data file in a case study, written as image files across a process
+        pool. Files whose content hash (and fmt/mode) match the last render
+        are skipped
+
+        Args:
+        path_rawdata (string): Folder of raw data files (Files.path_rawdata)
+        path_plots (string): Output folder for images (created if needed)
+        fmt (string, optional): Image format -- 'png' or 'svg'
+        mode (string, optional): Plot strategy (see plotdata.PlotData)
+        max_workers (int, optional): Worker processes; None uses all cores
+            and 1 renders in-process
+        """
+        self.path_rawdata = path_rawdata
+        self.path_plots = path_plots
+        self.fmt = fmt
+        self.mode = mode
+        self.max_workers = max_workers
+        self.pf_hashes = os.path.join(path_plots, 'plot_hashes.json')
+        self.df_results = None #One row per raw file with render status
+
+    @classmethod
+    def FromFiles(cls, files, **kwargs):
+        """
+        Instance writing to a 'plots' folder in the case study home
+        """
+        path_plots = files.path_home + 'plots' + os.sep
+        return cls(files.path_rawdata, path_plots, **kwargs)
+
+    """
+    =========================================================================
+    RenderAll Procedure
+    =========================================================================
+    """
+    def RenderAll(self):
+        """
+        Render changed raw files in parallel and tabulate status per file
+        ('rendered', 'skipped' or 'error')
+        """
+        import pandas as pd
+        os.makedirs(self.path_plots, exist_ok=True)
+        lst_files = BatchFitter(self.path_rawdata).FindRawFiles()
+        hashes_old = self.ReadHashes()
+
+        hashes, todo, results = {}, [], []
+        for file_raw in lst_files:
+            name = os.path.basename(file_raw)
+            hashes[name] = self.RenderKey(file_raw)
+            if hashes[name] == hashes_old.get(name) and \
+                    self.IsRendered(file_raw):
+                results.append({'file_raw': file_raw, 'status': 'skipped',
+                                'error': ''})
+            else:
+                todo.append(file_raw)
+
+        args = [(f, self.path_plots, self.fmt, self.mode) for f in todo]
+        if self.max_workers == 1 or len(todo) <= 1:
+            rendered = [self.RenderFile(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                rendered = list(pool.map(self.RenderFile, *zip(*args)))
+        results.extend(rendered)
+
+        #Only successful renders are remembered
+        errors = {os.path.basename(r['file_raw']) for r in rendered
+                  if r['status'] == 'error'}
+        self.WriteHashes({k: v for k, v in hashes.items() if k not in errors})
+
+        df = pd.DataFrame(results, columns=['file_raw', 'status', 'error'])
+        self.df_results = df.sort_values('file_raw', ignore_index=True)
+        return self.df_results
+
+    @staticmethod
+    def RenderFile(file_raw, path_plots, fmt='png', mode='auto'):
+        """
+        Worker: write <name>_raw.<fmt> and <name>_transformed.<fmt> (name
+        includes the extension) for one raw file using matplotlib Figure
+        objects (no pyplot, no display)
+        """
+        result = {'file_raw': file_raw, 'status': 'rendered', 'error': ''}
+        try:
+            from matplotlib.figure import Figure
+            roll = RollLength(file_raw=file_raw)
+            roll.ReadRawData()
+            roll.AddCalculatedRawCols()
+            roll.FitRawData()
+
+            plots = [('raw', 'diameter', 'Diameter (mm)',
+                      'Length vs. Diameter'),
+                     ('transformed', 'diam_m^2', 'Diameter Squared (m^2)',
+                      'Length vs. Diameter Squared')]
+            for suffix, col_x, x_label, title in plots:
+                fig = Figure()
+                ax = fig.subplots()
+                roll.XYDataPlot(roll.RawColumn(col_x), roll.RawColumn('length'),
+                                x_label, 'Length (m)', title, mode=mode,
+                                fit_xy=roll.FitLinePoints(col_x), ax=ax)
+                fig.savefig(PlotPath(file_raw, path_plots, suffix, fmt))
+        except Exception as e:
+            result.update(status='error', error=f'{type(e).__name__}: {e}')
+        return result
+
+    """
+    =========================================================================
+    Change detection utilities
+    =========================================================================
+    """
+    def RenderKey(self, file_raw):
+        return f'{RawDataCache.ContentHash(file_raw)}:{self.fmt}:{self.mode}'
+
+    def IsRendered(self, file_raw):
+        return all(os.path.isfile(PlotPath(file_raw, self.path_plots, s,
+                                           self.fmt))
+                   for s in ('raw', 'transformed'))
+
+    def ReadHashes(self):
+        if not os.path.isfile(self.pf_hashes): return {}
+        with open(self.pf_hashes) as f: return json.load(f)
+
+    def WriteHashes(self, hashes):
+        with open(self.pf_hashes, 'w') as f: json.dump(hashes, f, indent=2)
+
+
+def PlotPath(file_raw, path_plots, suffix, fmt):
+    """
+    Plot file named by the full raw file name (with extension) so roll_a.xlsx
+    and roll_a.csv in one folder don't overwrite each other's plots
+    """
+    name = os.path.basename(file_raw)
+    return os.path.join(path_plots, f'{name}_{suffix}.{fmt}')
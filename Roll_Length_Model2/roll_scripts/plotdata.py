@@ -0,0 +1,94 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import numpy as np
+
+#Point-count thresholds for PlotStrategy
+MAX_SCATTER_POINTS = 50000 #Exact scatter at or below this many points
+MAX_DECIMATE_POINTS = 2000000 #Min/max decimation up to this; density above
+DECIMATE_BUCKETS = 5000 #Buckets for min/max decimation (2 points each)
+DENSITY_BINS = 300 #Bins per axis for 2-D density rendering
+STRATEGIES = ('scatter', 'decimate', 'density')
+
+
+class PlotData:
+    """
+    Reduce large XY data to a bounded amount of drawing work so render time
+    stays roughly constant as raw data grows
+
+    Strategies (selected by point count in PlotStrategy):
+    * 'scatter'  - all points
+    * 'decimate' - per-bucket min and max of Y along the data order, which
+                   keeps the envelope, spikes and glitches visible
+    * 'density'  - 2-D histogram counts
+    """
+    @staticmethod
+    def PlotStrategy(n, mode='auto'):
+        """
+        Return 'scatter', 'decimate' or 'density' for n points. mode forces
+        one of those; other values raise ValueError
+        """
+        if mode in STRATEGIES: return mode
+        if mode != 'auto':
+            raise ValueError(f"Unknown plot mode {mode!r}; use 'auto' or one "
+                             f"of {STRATEGIES}")
+        if n <= MAX_SCATTER_POINTS: return 'scatter'
+        if n <= MAX_DECIMATE_POINTS: return 'decimate'
+        return 'density'
+
+    @staticmethod
+    def DecimateMinMax(X, Y, n_buckets=DECIMATE_BUCKETS):
+        """
+        Keep the min-Y and max-Y point of each of n_buckets contiguous
+        buckets (in data order). Returns (X, Y) with <= 2 * n_buckets points
+
+        Non-finite points (e.g. a sensor dropout) are dropped first, so a
+        bucket never holds only NaNs
+        """
+        X, Y = np.asarray(X), np.asarray(Y)
+        ok = np.isfinite(X) & np.isfinite(Y)
+        if not ok.all(): X, Y = X[ok], Y[ok]
+        n = Y.size
+        if n <= 2 * n_buckets: return X, Y
+
+        #Equal-size buckets over the first m points; remainder is one more
+        size = n // n_buckets
+        m = size * n_buckets
+        Yb = Y[:m].reshape(n_buckets, size)
+        offsets = np.arange(n_buckets) * size
+        idx = [offsets + np.argmin(Yb, axis=1),
+               offsets + np.argmax(Yb, axis=1)]
+        if m < n:
+            idx.append(m + np.array([np.argmin(Y[m:]), np.argmax(Y[m:])]))
+        idx = np.unique(np.concatenate(idx))
+        return X[idx], Y[idx]
+
+    @staticmethod
+    def Density2D(X, Y, bins=DENSITY_BINS):
+        """
+        2-D histogram of points. Returns (counts, x_edges, y_edges) with
+        counts shaped (len(x_edges) - 1, len(y_edges) - 1)
+        """
+        X, Y = np.asarray(X, dtype=np.float64), np.asarray(Y, dtype=np.float64)
+        ok = np.isfinite(X) & np.isfinite(Y)
+        return np.histogram2d(X[ok], Y[ok], bins=bins)
+
+    @classmethod
+    def Draw(cls, ax, X, Y, mode='auto'):
+        """
+        Draw X, Y on a matplotlib Axes with the strategy for len(Y) points.
+        Returns the strategy used
+        """
+        strategy = cls.PlotStrategy(np.size(Y), mode)
+        if strategy == 'scatter':
+            ax.scatter(X, Y)
+        elif strategy == 'decimate':
+            Xd, Yd = cls.DecimateMinMax(X, Y)
+            ax.scatter(Xd, Yd, s=4)
+        else:
+            from matplotlib.colors import LogNorm
+            counts, x_edges, y_edges = cls.Density2D(X, Y)
+            counts = np.ma.masked_equal(counts, 0)
+            mesh = ax.pcolormesh(x_edges, y_edges, counts.T, norm=LogNorm(),
+                                 cmap='viridis')
+            ax.figure.colorbar(mesh, ax=ax, label='Points per bin')
+        return strategy
@@ -1,7 +1,7 @@
 #Version 4/12/23 - Customize 4/27/23 for RollLength
 #J.D. Landgrebe/Data-Delve Engineer LLC
 #Covered under MIT Open Source License (https://github.com/jlandgre/Python_Projfiles)
-import inspect, os
+import copy, fnmatch, inspect, os
 
 class Files():
     """
@@ -29,9 +29,21 @@ class Files():
     * self.f_xxx is a filename with extension
     * self.path_subdir_xxx is a folder name or directory path suffix
 
+    Resolved layouts are cached per process (dict_layouts) so repeat
+    instancing with the same arguments skips the frame inspection and path
+    building. GetFileIndex() lists files under the data folders once
+
     JDL Updated 4/12/23 (Customied for PPM 7/12/23)
     """
+    dict_layouts = {} #Process-wide cache of resolved attributes by __init__ args
+    dict_indexes = {} #Process-wide cache of FileIndex objects by root paths
+
     def __init__(self, proj_abbrev, subdir_home='', IsTest=False, subdir_tests=''):
+        key = (proj_abbrev, subdir_home, IsTest, subdir_tests)
+        if key in Files.dict_layouts:
+            self.__dict__.update(copy.deepcopy(Files.dict_layouts[key]))
+            return
+
         self.IsTest = IsTest #Boolean toggle for test versus production mode
         self.subdir_tests = subdir_tests
         self.proj_abbrev = proj_abbrev
@@ -56,6 +68,7 @@ class Files():
         #Set generic and project-specific paths
         self.SetGenericProjectPaths()
         self.SetProjectSpecificPaths()
+        Files.dict_layouts[key] = copy.deepcopy(self.__dict__)
 
     def SetGenericProjectPaths(self):
         """
@@ -115,6 +128,17 @@ class Files():
         for i in range(len(lstdirs)-1, len(lstdirs) - iLevels-1, -1):
             self.lstpaths.append(os.sep.join(lstdirs[0:i]) + os.sep)
     
+    def GetFileIndex(self, refresh=False):
+        """
+        FileIndex of path_rawdata, path_data and path_case_studies (folders
+        that exist), cached per process until refresh=True
+        """
+        roots = tuple(p for p in (self.path_rawdata, self.path_data, 
+                                  self.path_case_studies) if os.path.isdir(p))
+        if refresh or roots not in Files.dict_indexes:
+            Files.dict_indexes[roots] = FileIndex(roots)
+        return Files.dict_indexes[roots]
+
     def PrintLocations(self):
       print('\n')
       print('files.path_root\n', self.path_root, '\n')
@@ -125,3 +149,70 @@ class Files():
       if self.IsTest:
         print('files.path_tests\n', self.path_tests, '\n')
 
+class FileIndex():
+    """
+    Index of files under one or more root folders, built by a single
+    os.scandir walk (each directory scanned once, even if roots are nested)
+    and queried by glob pattern or extension without touching the disk
+
+    Entries are (path, size, mtime) tuples with absolute paths
+    """
+    def __init__(self, roots):
+        self.roots = [os.path.abspath(r) for r in roots]
+        self.entries = [] #(path, size, mtime) for every file under roots
+        self.Build()
+
+    def Build(self):
+        """
+        Walk roots with os.scandir; a root inside another root is skipped
+        """
+        self.entries = []
+        scanned = []
+        for root in sorted(set(self.roots), key=len):
+            if any(IsUnder(root, s) for s in scanned): continue
+            scanned.append(root)
+            stack = [root]
+            while stack:
+                with os.scandir(stack.pop()) as it:
+                    for e in it:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                        elif e.is_file():
+                            st = e.stat()
+                            self.entries.append((e.path, st.st_size, 
+                                                 st.st_mtime))
+        self.entries.sort()
+
+    def Files(self, root=None):
+        """
+        Paths of all indexed files, optionally only those under root
+        """
+        if root is None: return [e[0] for e in self.entries]
+        root = os.path.abspath(root)
+        return [e[0] for e in self.entries if IsUnder(e[0], root)]
+
+    def Glob(self, pattern, root=None):
+        """
+        Paths whose path relative to root (or file name if root is None)
+        matches a glob pattern such as '*.xlsx' or 'case_*/raw_data/*.csv'
+        """
+        if root is None:
+            return [p for p in self.Files() 
+                    if fnmatch.fnmatch(os.path.basename(p), pattern)]
+        root = os.path.abspath(root)
+        return [p for p in self.Files(root)
+                if fnmatch.fnmatch(os.path.relpath(p, root), pattern)]
+
+    def ByExtension(self, extensions, root=None):
+        """
+        Paths with any of the given extensions (e.g. '.xlsx' or a tuple)
+        """
+        if isinstance(extensions, str): extensions = (extensions,)
+        extensions = tuple(e.lower() for e in extensions)
+        return [p for p in self.Files(root) if p.lower().endswith(extensions)]
+
+def IsUnder(path, root):
+    """
+    True if path is root or inside it
+    """
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
@@ -0,0 +1,120 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import json, os, struct
+import numpy as np
+
+#File layout: MAGIC, uint32 JSON length, JSON dtype descr, zero padding to
+#HEADER_ALIGN bytes, then fixed-width records (one per measurement)
+MAGIC = b'ROLLRAW\x01'
+HEADER_ALIGN = 64
+EXT = '.rlb'
+
+
+class RawBinary:
+    """
+    Native binary format for length [m] vs. diameter [mm] measurements
+
+    A small header describes a fixed-width record dtype; records follow
+    back to back, so appends are a single write and readers open the file
+    with numpy.memmap, which loads pages only as they are read (RollLength
+    fits stream the columns in fixed-size blocks). The row count comes from
+    the file size, so a reader never sees a partially written trailing 
+    record
+    """
+    @staticmethod
+    def RecordDtype(dtype=np.float64, columns=('length', 'diameter')):
+        return np.dtype([(c, np.dtype(dtype).newbyteorder('<'))
+                         for c in columns])
+
+    @classmethod
+    def WriteHeader(cls, f, rec_dtype):
+        descr = json.dumps([[name, rec_dtype.fields[name][0].str]
+                            for name in rec_dtype.names]).encode()
+        header = MAGIC + struct.pack('<I', len(descr)) + descr
+        header += b'\x00' * (-len(header) % HEADER_ALIGN)
+        f.write(header)
+
+    @staticmethod
+    def ReadHeader(pf):
+        """
+        Returns (record dtype, header size in bytes)
+        """
+        with open(pf, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{pf} is not a raw measurement binary file.")
+            n = struct.unpack('<I', f.read(4))[0]
+            descr = json.loads(f.read(n).decode())
+        size = len(MAGIC) + 4 + n
+        size += -size % HEADER_ALIGN
+        return np.dtype([tuple(d) for d in descr]), size
+
+    @classmethod
+    def Open(cls, pf):
+        """
+        Read-only memory-mapped record array of all complete records.
+        Columns are strided views into the mapping, e.g. Open(pf)['diameter'];
+        a contiguous array of one column (np.ascontiguousarray) is a copy
+        """
+        rec_dtype, offset = cls.ReadHeader(pf)
+        n_rows = (os.path.getsize(pf) - offset) // rec_dtype.itemsize
+        if n_rows == 0: return np.zeros(0, dtype=rec_dtype)
+        return np.memmap(pf, dtype=rec_dtype, mode='r', offset=offset,
+                         shape=(n_rows,))
+
+    @classmethod
+    def FromDataFrame(cls, df, pf, dtype=np.float64):
+        """
+        Write (or overwrite) pf from a DataFrame's length and diameter
+        """
+        if os.path.isfile(pf): os.remove(pf)
+        with RawBinaryWriter(pf, dtype=dtype) as writer:
+            writer.Append(df['length'].values, df['diameter'].values)
+
+
+class RawBinaryWriter:
+    def __init__(self, pf, dtype=np.float64, columns=('length', 'diameter')):
+        """
+        Append-only writer for a line logger. Creates pf with a header if it
+        does not exist; otherwise appends using the file's own record dtype
+
+        Args:
+        pf (string): Binary raw data file path (.rlb)
+        dtype (numpy dtype, optional): Column dtype for a new file
+        columns (tuple, optional): Column names for a new file
+        """
+        self.pf = pf
+        if os.path.isfile(pf) and os.path.getsize(pf) > 0:
+            self.rec_dtype, offset = RawBinary.ReadHeader(pf)
+            self.f = open(pf, 'ab')
+
+            #Drop a partial trailing record left by an interrupted write
+            extra = (os.path.getsize(pf) - offset) % self.rec_dtype.itemsize
+            if extra: self.f.truncate(os.path.getsize(pf) - extra)
+        else:
+            self.rec_dtype = RawBinary.RecordDtype(dtype, columns)
+            self.f = open(pf, 'wb')
+            RawBinary.WriteHeader(self.f, self.rec_dtype)
+
+    def Append(self, *cols, **named):
+        """
+        Append samples given positionally in column order or by name,
+        e.g. Append(length, diameter) or Append(length=..., diameter=...)
+        """
+        values = dict(zip(self.rec_dtype.names, cols), **named)
+        arrays = np.broadcast_arrays(*[np.atleast_1d(values[c])
+                                       for c in self.rec_dtype.names])
+        records = np.empty(arrays[0].size, dtype=self.rec_dtype)
+        for c, arr in zip(self.rec_dtype.names, arrays): records[c] = arr
+        self.f.write(records.tobytes())
+
+    def Flush(self):
+        self.f.flush()
+
+    def Close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.Close()
@@ -0,0 +1,157 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import hashlib, json, os
+import numpy as np
+
+
+class RawDataCache:
+    def __init__(self, path_cache, max_bytes=500 * 2**20):
+        """
+        On-disk cache of parsed raw data tables so that re-running a case
+        study over unchanged raw_data files skips Excel parsing
+
+        Each source file maps to one uncompressed .npz entry (one array per
+        column) named by a hash of its absolute path. An entry is valid while
+        the source's mtime and size match; if they differ, the content hash
+        decides. Least recently used entries are evicted once the cache
+        exceeds max_bytes
+
+        Args:
+        path_cache (string): Directory for cache entries (created if needed)
+        max_bytes (int, optional): Size bound for all entries combined
+        """
+        self.path_cache = path_cache
+        self.max_bytes = max_bytes
+        self.hits = 0 #Reads served from cache
+        self.misses = 0 #Reads that parsed the source file
+        os.makedirs(self.path_cache, exist_ok=True)
+
+    def Read(self, file_raw, reader=None):
+        """
+        Return the raw data DataFrame for file_raw -- from cache if valid,
+        else parse with reader (default pd.read_excel) and store the result
+        """
+        import pandas as pd
+        df = self.Lookup(file_raw)
+        if df is not None:
+            self.hits += 1
+            return df
+
+        self.misses += 1
+        if reader is None: reader = pd.read_excel
+        df = reader(file_raw)
+        self.Store(file_raw, df)
+        return df
+
+    def Lookup(self, file_raw):
+        """
+        Return cached DataFrame for file_raw or None if missing or stale
+        """
+        import pandas as pd
+        pf_entry = self.EntryPath(file_raw)
+        if not os.path.isfile(pf_entry): return None
+
+        with np.load(pf_entry, allow_pickle=False) as npz:
+            arrays = {k: npz[k] for k in npz.files}
+        meta = json.loads(str(arrays.pop('__meta__')))
+
+        #Touched but unchanged source (same hash) -- refresh stored stat
+        st = os.stat(file_raw)
+        if (meta['mtime_ns'], meta['size']) != (st.st_mtime_ns, st.st_size):
+            if meta['hash'] != self.ContentHash(file_raw): return None
+            meta['mtime_ns'], meta['size'] = st.st_mtime_ns, st.st_size
+            self.WriteEntry(pf_entry, meta, arrays)
+
+        #Mark entry as recently used for eviction
+        os.utime(pf_entry)
+        cols = {c: arrays[f'col{i}'] for i, c in enumerate(meta['columns'])}
+        return pd.DataFrame(cols)
+
+    def Store(self, file_raw, df):
+        """
+        Write df's columns as a cache entry for file_raw and enforce 
+        max_bytes. Tables the entry cannot round-trip exactly (text or mixed
+        columns, non-string headers) are not cached; returns False for them
+        """
+        if not self.IsCacheable(df):
+            self.Invalidate(file_raw)
+            return False
+        st = os.stat(file_raw)
+        meta = {'file_raw': os.path.abspath(file_raw),
+                'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                'hash': self.ContentHash(file_raw),
+                'columns': [str(c) for c in df.columns]}
+        arrays = {f'col{i}': df[c].to_numpy()
+                  for i, c in enumerate(df.columns)}
+        self.WriteEntry(self.EntryPath(file_raw), meta, arrays)
+        self.Evict()
+        return True
+
+    def Invalidate(self, file_raw):
+        """
+        Remove the cache entry for file_raw if present
+        """
+        pf_entry = self.EntryPath(file_raw)
+        if os.path.isfile(pf_entry): os.remove(pf_entry)
+
+    def Clear(self):
+        """
+        Remove all cache entries
+        """
+        for pf_entry in self.ListEntries(): os.remove(pf_entry)
+
+    def Evict(self):
+        """
+        Delete least recently used entries until total size <= max_bytes
+        """
+        entries = [(os.stat(pf).st_mtime_ns, os.path.getsize(pf), pf)
+                   for pf in self.ListEntries()]
+        total = sum(size for _, size, _ in entries)
+        for _, size, pf in sorted(entries):
+            if total <= self.max_bytes: break
+            os.remove(pf)
+            total -= size
+
+    """
+    =========================================================================
+    Utility methods
+    =========================================================================
+    """
+    def EntryPath(self, file_raw):
+        key = hashlib.sha1(os.path.abspath(file_raw).encode()).hexdigest()
+        return os.path.join(self.path_cache, key + '.npz')
+
+    def ListEntries(self):
+        return [os.path.join(self.path_cache, f)
+                for f in os.listdir(self.path_cache) if f.endswith('.npz')]
+
+    @staticmethod
+    def WriteEntry(pf_entry, meta, arrays):
+        """
+        Atomically (re)write an entry -- temp file then rename
+        """
+        pf_tmp = pf_entry + '.tmp'
+        with open(pf_tmp, 'wb') as f:
+            np.savez(f, __meta__=np.array(json.dumps(meta)), **arrays)
+        os.replace(pf_tmp, pf_entry)
+
+    @staticmethod
+    def IsCacheable(df):
+        """
+        True if every column is a plain numpy numeric or datetime column 
+        (stored as-is) and every header is a string. Object columns would lose missing values and 
+        mixed types in the .npz entry, so those files are always parsed
+        """
+        return all(isinstance(c, str) for c in df.columns) and \
+            all(isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM'
+                for dtype in df.dtypes)
+
+    @staticmethod
+    def ContentHash(file_raw, chunk_size=2**20):
+        """
+        BLAKE2b digest of the source file's bytes
+        """
+        h = hashlib.blake2b(digest_size=16)
+        with open(file_raw, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''): h.update(chunk)
+        return h.hexdigest()
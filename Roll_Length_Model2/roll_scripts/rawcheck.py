@@ -0,0 +1,103 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import numpy as np
+
+#Row checks in report order
+CHECKS = ['nan', 'non_positive', 'non_monotonic', 'duplicate']
+
+
+class RawDataValidator:
+    def __init__(self, tol_length=0., tol_diameter=0.,
+                 drop=('nan', 'non_positive', 'duplicate')):
+        """
+        Vectorized quality gate for length [m] vs. diameter [mm] raw data,
+        run between ReadRawData and FitRawData. Each check is one array
+        expression over the whole table (duplicates need one sort), so it is
+        cheap enough to run on every file in a batch
+
+        Row checks (see CHECKS):
+        nan: length or diameter missing or infinite
+        non_positive: diameter <= 0
+        non_monotonic: both rows of each consecutive pair where length and
+            diameter move in opposite directions by more than the 
+            tolerances. Length on the roll rises with diameter (whichever
+            way the log is ordered). A one-row glitch makes a reversal with
+            only one of its neighbors, so flagging both rows always catches
+            the glitch -- at the cost of also flagging that neighbor
+        duplicate: repeat of an earlier (length, diameter) row
+
+        Args:
+        tol_length (float, optional): Length noise [m] ignored by
+            non_monotonic
+        tol_diameter (float, optional): Diameter noise [mm] ignored by
+            non_monotonic
+        drop (tuple, optional): Checks whose rows Clean removes
+        """
+        self.tol_length = tol_length
+        self.tol_diameter = tol_diameter
+        self.drop = tuple(drop)
+
+        self.masks = None #Check name -> boolean array of flagged rows
+        self.valid = None #Boolean array of rows kept by Clean
+        self.report = None #Counts per check (see Check)
+
+    """
+    =========================================================================
+    Check Procedure
+    =========================================================================
+    """
+    def Check(self, length, diameter):
+        """
+        Flag rows for every check; sets masks and valid and returns report
+        dict with n_rows, n_<check> counts, n_valid and IsValid (no rows
+        flagged by any check)
+        """
+        length = np.asarray(length)
+        diameter = np.asarray(diameter)
+        n = length.size
+        self.masks = {}
+        self.masks['nan'] = ~(np.isfinite(length) & np.isfinite(diameter))
+        self.masks['non_positive'] = diameter <= 0
+
+        #NaN differences compare False, so gaps are not reported twice
+        dl, dd = np.diff(length), np.diff(diameter)
+        up_down = (dl > self.tol_length) & (dd < -self.tol_diameter)
+        down_up = (dl < -self.tol_length) & (dd > self.tol_diameter)
+        reversal = up_down | down_up
+        self.masks['non_monotonic'] = np.concatenate([reversal, [False]]) | \
+            np.concatenate([[False], reversal])
+        self.masks['duplicate'] = self.DuplicateRows(length, diameter)
+
+        self.valid = np.ones(n, dtype=bool)
+        for check in self.drop: self.valid &= ~self.masks[check]
+
+        self.report = {'n_rows': n}
+        for check in CHECKS:
+            self.report[f'n_{check}'] = int(self.masks[check].sum())
+        self.report['n_valid'] = int(self.valid.sum())
+        self.report['IsValid'] = not any(self.report[f'n_{c}'] for c in CHECKS)
+        return self.report
+
+    @staticmethod
+    def DuplicateRows(length, diameter):
+        """
+        Mask of rows that repeat an earlier (length, diameter) pair. The
+        first occurrence is kept (lexsort is stable)
+        """
+        is_dup = np.zeros(length.size, dtype=bool)
+        if length.size < 2: return is_dup
+        order = np.lexsort((diameter, length))
+        l_sorted, d_sorted = length[order], diameter[order]
+        same = (l_sorted[1:] == l_sorted[:-1]) & (d_sorted[1:] == d_sorted[:-1])
+        is_dup[order[1:][same]] = True
+        return is_dup
+
+    def Clean(self, data):
+        """
+        data without the rows flagged by drop checks (DataFrame or record
+        array from the last Check). Returns data itself -- no copy -- when
+        nothing is dropped; otherwise one copy of the kept rows
+        """
+        if self.valid.all(): return data
+        if hasattr(data, 'iloc'): return data.iloc[np.flatnonzero(self.valid)]
+        return data[self.valid]
@@ -0,0 +1,202 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import sqlite3, time
+from batchfit import BatchFitter
+from rawcache import RawDataCache
+
+#Columns stored per fit and per length calculation (besides id/created)
+FIT_COLS = ['file_hash', 'file_raw', 'case_study', 'fit_method', 'n_rows',
+            'slope', 'intercept', 'R_squared', 'caliper']
+LENGTH_COLS = ['case_study', 'diam_roll', 'diam_core', 'caliper', 'length']
+
+#SQLite limits bound parameters per statement; lookups are chunked to this
+MAX_PARAMS = 900
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fits (
+    id INTEGER PRIMARY KEY,
+    file_hash TEXT NOT NULL,
+    file_raw TEXT,
+    case_study TEXT,
+    fit_method TEXT NOT NULL DEFAULT 'ols',
+    n_rows INTEGER,
+    slope REAL,
+    intercept REAL,
+    R_squared REAL,
+    caliper REAL,
+    created REAL NOT NULL,
+    UNIQUE (file_hash, fit_method));
+CREATE INDEX IF NOT EXISTS idx_fits_caliper ON fits (caliper);
+CREATE INDEX IF NOT EXISTS idx_fits_case_study ON fits (case_study);
+
+CREATE TABLE IF NOT EXISTS lengths (
+    id INTEGER PRIMARY KEY,
+    case_study TEXT,
+    diam_roll REAL,
+    diam_core REAL,
+    caliper REAL,
+    length REAL,
+    created REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_lengths_caliper ON lengths (caliper);
+CREATE INDEX IF NOT EXISTS idx_lengths_case_study ON lengths (case_study);
+"""
+
+
+class ResultStore:
+    def __init__(self, pf_db):
+        """
+        Local SQLite store of CaliperFromRawData fits and CalculateLength
+        results, indexed on caliper and case study. Fits are keyed by the
+        raw file's content hash (and fit method) so reruns can skip files
+        that were already fit
+
+        Args:
+        pf_db (string): SQLite database file (created if missing)
+        """
+        self.pf_db = pf_db
+        self.conn = sqlite3.connect(pf_db)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def Close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.Close()
+
+    """
+    =========================================================================
+    Bulk insert
+    =========================================================================
+    """
+    def InsertFits(self, records):
+        """
+        Insert (or replace same file_hash/fit_method) fit result dicts in one
+        transaction. Missing keys are stored as NULL; fit_method defaults to
+        'ols'. Rows with an error entry are skipped
+        """
+        now = time.time()
+        records = [dict(r, fit_method=r.get('fit_method') or 'ols')
+                   for r in self.Records(records) if not r.get('error')]
+        rows = [tuple(r.get(c) for c in FIT_COLS) + (now,) for r in records]
+        sql = (f"INSERT OR REPLACE INTO fits ({', '.join(FIT_COLS)}, created) "
+               f"VALUES ({', '.join('?' * (len(FIT_COLS) + 1))})")
+        with self.conn: self.conn.executemany(sql, rows)
+        return len(rows)
+
+    def InsertLengths(self, records, case_study=None):
+        """
+        Insert length result dicts or a DataFrame with diam_roll, diam_core,
+        caliper and length columns in one transaction
+        """
+        now = time.time()
+        rows = [(r.get('case_study', case_study), r.get('diam_roll'),
+                 r.get('diam_core'), r.get('caliper'), r.get('length'), now)
+                for r in self.Records(records)]
+        sql = (f"INSERT INTO lengths ({', '.join(LENGTH_COLS)}, created) "
+               f"VALUES ({', '.join('?' * (len(LENGTH_COLS) + 1))})")
+        with self.conn: self.conn.executemany(sql, rows)
+        return len(rows)
+
+    """
+    =========================================================================
+    Lookup and query
+    =========================================================================
+    """
+    def LookupFits(self, file_hashes, fit_method='ols'):
+        """
+        Stored fits for many hashes: dict of file_hash -> row dict
+        """
+        file_hashes = list(file_hashes)
+        found = {}
+        for i in range(0, len(file_hashes), MAX_PARAMS):
+            chunk = file_hashes[i:i + MAX_PARAMS]
+            sql = (f"SELECT * FROM fits WHERE fit_method = ? AND file_hash "
+                   f"IN ({', '.join('?' * len(chunk))})")
+            for row in self.conn.execute(sql, [fit_method] + chunk):
+                found[row['file_hash']] = dict(row)
+        return found
+
+    def LookupFit(self, file_hash, fit_method='ols'):
+        return self.LookupFits([file_hash], fit_method).get(file_hash)
+
+    def QueryFits(self, case_study=None, caliper_min=None, caliper_max=None):
+        """
+        DataFrame of stored fits filtered by case study and caliper range
+        """
+        return self.Query('fits', case_study, caliper_min, caliper_max)
+
+    def QueryLengths(self, case_study=None, caliper_min=None,
+                     caliper_max=None):
+        return self.Query('lengths', case_study, caliper_min, caliper_max)
+
+    def IterQuery(self, table, chunk_size=100000, case_study=None,
+                  caliper_min=None, caliper_max=None):
+        """
+        Stored 'fits' or 'lengths' as DataFrame chunks of chunk_size rows
+        (e.g. for exporter.ResultExporter on large tables)
+        """
+        if table not in ('fits', 'lengths'):
+            raise ValueError(f"Unknown result table: {table}")
+        return self.Query(table, case_study, caliper_min, caliper_max,
+                          chunksize=chunk_size)
+
+    def Query(self, table, case_study, caliper_min, caliper_max,
+              chunksize=None):
+        import pandas as pd
+        where, params = [], []
+        if case_study is not None:
+            where.append('case_study = ?'), params.append(case_study)
+        if caliper_min is not None:
+            where.append('caliper >= ?'), params.append(caliper_min)
+        if caliper_max is not None:
+            where.append('caliper <= ?'), params.append(caliper_max)
+        sql = f'SELECT * FROM {table}'
+        if where: sql += ' WHERE ' + ' AND '.join(where)
+        return pd.read_sql_query(sql + ' ORDER BY id', self.conn,
+                                 params=params, chunksize=chunksize)
+
+    """
+    =========================================================================
+    FitFiles Procedure - fit only files not already in the store
+    =========================================================================
+    """
+    def FitFiles(self, lst_files, case_study=None):
+        """
+        Fit raw files whose content hash has no stored fit, store the new
+        results and return a DataFrame of results for all files (stored or
+        new) with an IsCached column
+        """
+        import pandas as pd
+        hashes = {f: RawDataCache.ContentHash(f) for f in lst_files}
+        stored = self.LookupFits(hashes.values())
+
+        results, new = [], []
+        for f in lst_files:
+            if hashes[f] in stored:
+                results.append(dict(stored[hashes[f]], file_raw=f,
+                                    IsCached=True))
+                continue
+            result = BatchFitter.FitFile(f)
+            result.update(file_hash=hashes[f], case_study=case_study,
+                          fit_method='ols', IsCached=False)
+            results.append(result)
+            new.append(result)
+        self.InsertFits(new)
+
+        cols = ['file_raw', 'file_hash', 'case_study', 'n_rows', 'slope',
+                'intercept', 'R_squared', 'caliper', 'IsCached', 'error']
+        return pd.DataFrame(results).reindex(columns=cols)
+
+    @staticmethod
+    def Records(records):
+        """
+        Accept a list of dicts or a DataFrame
+        """
+        if hasattr(records, 'to_dict'): return records.to_dict('records')
+        return records
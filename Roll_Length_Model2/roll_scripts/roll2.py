@@ -1,13 +1,19 @@
 #Version 5/1/23
-from sklearn.linear_model import LinearRegression
-import matplotlib.pyplot as plt
-import math
-import pandas as pd
+#Core length/caliper math needs only numpy. pandas and matplotlib are
+#imported inside the methods that use them to keep module import fast
+import functools, math
+import numpy as np
+from fitstats import (BLOCK_ROWS, BootstrapFit, CheckFinite, LinearFitStats,
+                      RobustLinearFit)
+from instrument import Instrumented
+import rawbin
+from rawcheck import RawDataValidator
 #2345678901234567890123456789012345678901234567890123456789012345678901234567890
 
 
 class RollLength:
-    def __init__(self, file_raw='', diam_roll=None, diam_core=None, caliper=None):
+    def __init__(self, file_raw='', diam_roll=None, diam_core=None, caliper=None,
+                 raw_cache=None, IsLowMemory=False, raw_dtype=np.float64):
         """
         Initializes a RollLength object
         JDL 4/27/23
@@ -15,11 +21,19 @@ class RollLength:
         Args:
         file_raw (string, optional): Directory path + filename for raw, length 
             versus diam data where rows represent measurements on a roll as 
-            material is unwound.
+            material is unwound. Excel, .csv or binary .rlb (see rawbin.py)
         diam_core (float, optional): Diameter in mm of the core that the 
             material is wound onto.
         diam_roll (float, optional): Roll diameter [mm] for the substrate roll
         caliper (float, optional): Thickness of the substrate measured in mm.
+        raw_cache (RawDataCache, optional): On-disk cache of parsed raw data
+            files (see rawcache.py). If None, file_raw is parsed every read
+        IsLowMemory (Boolean, optional): Keep only length and diameter 
+            columns in df_raw and compute diam_m^2 on demand (see RawColumn)
+        raw_dtype (numpy dtype, optional): dtype for df_raw in low memory
+            mode. np.float32 halves df_raw memory (the fit upcasts fixed-
+            size blocks, see fitstats.BLOCK_ROWS); fitted caliper then 
+            agrees with float64 to within its 0.0001 mm rounding
         """
 
         #CalculateRollLength procedure
@@ -30,10 +44,23 @@ class RollLength:
 
         #CaliperFromRawData procedure attributes 
         self.file_raw = file_raw 
+        self.raw_cache = raw_cache #Optional parsed raw data cache
+        self.IsLowMemory = IsLowMemory #Project raw data; no calculated cols
+        self.raw_dtype = raw_dtype #df_raw dtype if IsLowMemory
         self.df_raw = None #Df with raw length [m] vs. diam [mm] exptl. data
+        self.raw_mmap = None #Memory-mapped records if file_raw is .rlb
+        self.raw_quality = None #Quality report dict from ValidateRawData
         self.slope = None #Calculated slope from linear fit
         self.intercept = None #Calculated y-intercept from linear fit
         self.R_squared = None #Calculated R-Squared from linear fit
+        self.fit_stats = None #Running sums for streaming/incremental fits
+        self.fit_weights = None #Per-point weights from robust fit
+        self.outliers = None #Boolean mask of points rejected by robust fit
+        self.fit_ci = None #Bootstrap (low, high) for slope, intercept, caliper
+
+        #Memo keys - property inputs at last run; a changed key means rerun
+        self.key_caliper = None #(file_raw, caliper) after CaliperFromRawData
+        self.key_length = None #(diam_roll, diam_core, caliper) for length
 
     """
     =========================================================================
@@ -45,55 +72,171 @@ class RollLength:
         """
         Example of Class Property -- returns just the caliper after running
         the procedure to open raw data file, transform and fit the data
+
+        Memoized: the procedure only reruns if file_raw or caliper changed
+        since the last run (or after Invalidate)
         """
-        self.CaliperFromRawDataProcedure()
+        if self.key_caliper != (self.file_raw, self.caliper):
+            self.CaliperFromRawDataProcedure()
         return self.caliper
 
-    def CaliperFromRawDataProcedure(self):
+    @Instrumented
+    def CaliperFromRawDataProcedure(self, robust=False, validate=False):
         """
         Procedure to fit a line to transformed raw, length versus diam data
         and thereby enable calculation of an effective caliper for the
         material on a roll of substrate.
 
         This use case only uses the file_raw Class input --to read in raw
-        data
+        data. robust=True uses the outlier-resistant fit (see FitRawData).
+        validate=True checks raw data and fits only valid rows (see 
+        ValidateRawData)
         """
         self.ReadRawData()
+        if validate: self.ValidateRawData(IsClean=True)
         self.AddCalculatedRawCols()
-        self.FitRawData()
+        self.FitRawData(robust=robust)
         self.CalculateCaliper()
+        self.key_caliper = (self.file_raw, self.caliper)
     
+    @Instrumented
     def ReadRawData(self):
         """
         Import experimental length versus diam data to Pandas DataFrame
+        (Excel workbook or .csv). IsLowMemory reads only length and 
+        diameter columns as raw_dtype
+
+        Binary .rlb files are memory-mapped into raw_mmap instead (df_raw 
+        stays None; pages load as they are read and FitRawData reads them in
+        blocks); use RawColumn to access either source
         """
-        self.df_raw = pd.read_excel(self.file_raw)
+        self.raw_mmap = None
+        if str(self.file_raw).lower().endswith(rawbin.EXT):
+            self.df_raw = None
+            self.raw_mmap = rawbin.RawBinary.Open(self.file_raw)
+            return
+
+        import pandas as pd
+        reader = pd.read_excel
+        if str(self.file_raw).lower().endswith('.csv'): reader = pd.read_csv
+
+        if self.raw_cache is not None:
+            self.df_raw = self.raw_cache.Read(self.file_raw, reader=reader)
+        elif self.IsLowMemory:
+            cols = ['length', 'diameter']
+            self.df_raw = reader(self.file_raw, usecols=cols, 
+                                 dtype={c: self.raw_dtype for c in cols})
+        else:
+            self.df_raw = reader(self.file_raw)
+
+        if self.IsLowMemory:
+            self.df_raw = self.df_raw[['length', 'diameter']].astype(
+                self.raw_dtype)
     
+    @Instrumented
+    def ValidateRawData(self, IsClean=False, validator=None):
+        """
+        Check raw data for NaNs, non-positive diameters, non-monotonic rows
+        and duplicates (see rawcheck.py); sets and returns raw_quality. 
+        IsClean drops invalid rows from df_raw or raw_mmap (no copy if none
+        are invalid) and raises ValueError if fewer than two rows remain
+        """
+        if validator is None: validator = RawDataValidator()
+        self.raw_quality = validator.Check(self.RawColumn('length'), 
+                                           self.RawColumn('diameter'))
+        if not IsClean: return self.raw_quality
+
+        if self.raw_quality['n_valid'] < 2:
+            raise ValueError(f"Too few valid raw data rows to fit: "
+                             f"{self.raw_quality}")
+        if self.raw_mmap is not None:
+            self.raw_mmap = validator.Clean(self.raw_mmap)
+        else:
+            self.df_raw = validator.Clean(self.df_raw)
+        return self.raw_quality
+
+    @Instrumented
     def AddCalculatedRawCols(self):
         """
         Add Calculated columns to length, diam raw measurement data
+        (skipped if IsLowMemory or memory-mapped -- RawColumn computes them
+        on demand)
         """
+        if self.IsLowMemory or self.raw_mmap is not None: return
         self.df_raw['diam_m'] = self.df_raw['diameter'] / 1000
         self.df_raw['diam_m^2'] = self.df_raw['diam_m'] ** 2
 
-    def FitRawData(self):
+    @Instrumented
+    def FitRawData(self, robust=False):
         """
         Calculate slope, intercept, and R-squared attributes for 
-        raw data linear fit
+        raw data linear fit (closed-form least squares; see fitstats.py)
+
+        robust=True fits with RobustLinearFit so glitched readings don't 
+        skew slope; fit_weights and outliers then report down-weighted and 
+        rejected points (R_squared is weighted)
         """
-        if self.df_raw is None:
+        if self.df_raw is None and self.raw_mmap is None:
             raise ValueError("No raw data available to fit.")
 
-        X = self.df_raw['diam_m^2'].values.reshape(-1, 1)
-        y = self.df_raw['length'].values
-
-        reg = LinearRegression()
-        reg.fit(X, y)
+        if robust:
+            x, y = self.RawColumn('diam_m^2'), self.RawColumn('length')
+            fit = RobustLinearFit()
+            self.slope, self.intercept, self.R_squared = fit.Fit(x, y)
+            self.fit_weights, self.outliers = fit.weights, fit.outliers
+            self.fit_stats = None
+            return
 
-        self.slope = reg.coef_[0]
-        self.intercept = reg.intercept_
-        self.R_squared = reg.score(X, y)
+        #Keep the sums so AppendRawData extends this fit. Sums build in 
+        #blocks from the stored columns, so fit memory doesn't grow with rows
+        self.fit_stats = None
+        stats = LinearFitStats()
+        self.UpdateFitStats(self.RawColumn('length'), 
+                            self.RawColumn('diameter'), stats)
+        stats.CalculateFit()
+        self.fit_stats = stats
+        self.fit_weights, self.outliers = None, None
+        self.slope = stats.slope
+        self.intercept = stats.intercept
+        self.R_squared = stats.R_squared
     
+    def RawColumn(self, col):
+        """
+        Values of a raw data column from df_raw or raw_mmap. Calculated 
+        columns (diam_m, diam_m^2) missing in low memory or memory-mapped
+        mode are computed on demand as a temporary array in the source's 
+        dtype instead of being stored
+        """
+        if self.raw_mmap is not None:
+            if col in self.raw_mmap.dtype.names: return self.raw_mmap[col]
+            diameter = self.raw_mmap['diameter']
+        else:
+            if col in self.df_raw.columns: return self.df_raw[col].values
+            diameter = self.df_raw['diameter'].values
+        if col not in ('diam_m', 'diam_m^2'): raise KeyError(col)
+
+        diam_m = diameter / 1000
+        if col == 'diam_m^2': np.square(diam_m, out=diam_m)
+        return diam_m
+
+    def BootstrapFitRawData(self, n_boot=2000, ci=95, seed=0, 
+                            max_bytes=64 * 2**20, max_workers=1):
+        """
+        Bootstrap confidence intervals for slope, intercept and caliper 
+        [mm] from the transformed raw data (see fitstats.BootstrapFit).
+        Sets and returns fit_ci
+        """
+        boot = BootstrapFit(n_boot=n_boot, ci=ci, seed=seed, 
+                            max_bytes=max_bytes, max_workers=max_workers)
+        self.fit_ci = boot.Fit(self.RawColumn('diam_m^2'), 
+                               self.RawColumn('length'))
+        with np.errstate(divide='ignore'):
+            calipers = np.pi / (4 * boot.slopes) * 1000
+        low, high = boot.Interval(calipers)
+        self.fit_ci['caliper'] = (round(low, 4), round(high, 4))
+        return self.fit_ci
+
+    @Instrumented
     def CalculateCaliper(self):
         """
         Calculate the caliper attribute from the slope and convert to mm
@@ -103,35 +246,115 @@ class RollLength:
         self.caliper *= 1000
         self.caliper = round(self.caliper, 4)
 
-    def PlotLengthVsDiameter(self):
-        plt.scatter(self.df_raw['diameter'], self.df_raw['length'])
-        plt.xlabel('Diameter (mm)')
-        plt.ylabel('Length (m)')
-        plt.title('Length vs. Diameter')
-        plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-        plt.show()
+    """
+    =========================================================================
+    CaliperFromRawData Streaming - constant-memory fit over large CSV logs
+    and incremental updates as new rows are logged
+    =========================================================================
+    """
+    @Instrumented
+    def CaliperFromRawDataStreaming(self, chunksize=100000):
+        """
+        Streaming variant of CaliperFromRawDataProcedure. Reads file_raw
+        (CSV with length and diameter columns) in chunks and accumulates
+        running sums, so df_raw is never held in memory
+        """
+        import pandas as pd
+        self.fit_stats = LinearFitStats()
+        reader = pd.read_csv(self.file_raw, usecols=['length', 'diameter'], 
+                             chunksize=chunksize)
+        for chunk in reader:
+            self.UpdateFitStats(chunk['length'].values, 
+                                chunk['diameter'].values)
+        self.FitFromStats()
+        return self.caliper
 
-    def PlotLengthVsDiamSquared(self):
-        plt.scatter(self.df_raw['diam_m^2'], self.df_raw['length'])
-        plt.xlabel('Diameter Squared (m^2)')
-        plt.ylabel('Length (m)')
-        plt.title('Length vs. Diameter Squared')
-        plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-        plt.show()
+    def AppendRawData(self, length, diameter):
+        """
+        Add newly logged length [m] and diameter [mm] rows to the running
+        fit and update slope, intercept, R_squared and caliper without 
+        refitting earlier rows. Extends an OLS fit from FitRawData or 
+        streaming; a robust fit has no running sums and raises ValueError
+        """
+        if self.fit_stats is None:
+            if self.slope is not None:
+                raise ValueError("Existing fit has no running sums to "
+                                 "append to (robust fit?); refit instead.")
+            self.fit_stats = LinearFitStats()
+        self.UpdateFitStats(length, diameter)
+        self.FitFromStats()
+        return self.caliper
+
+    def UpdateFitStats(self, length, diameter, stats=None):
+        """
+        Transform diameter [mm] to diam_m^2 and add points to stats (default
+        fit_stats), BLOCK_ROWS at a time so temporaries stay a fixed size.
+        All blocks are checked first, so non-finite points raise ValueError
+        with the sums unchanged
+        """
+        if stats is None: stats = self.fit_stats
+        length, diameter = np.asarray(length), np.asarray(diameter)
+        if diameter.size != length.size:
+            raise ValueError("length and diameter must have the same size.")
+        blocks = range(0, diameter.size, BLOCK_ROWS)
+        for i in blocks:
+            CheckFinite(diameter[i:i + BLOCK_ROWS], length[i:i + BLOCK_ROWS])
+        for i in blocks:
+            diam_m = diameter[i:i + BLOCK_ROWS].astype(np.float64) / 1000
+            np.square(diam_m, out=diam_m)
+            stats.Update(diam_m, length[i:i + BLOCK_ROWS])
+
+    def FitFromStats(self):
+        """
+        Set fit attributes and caliper from the running sums
+        """
+        self.slope, self.intercept, self.R_squared = \
+            self.fit_stats.CalculateFit()
+        self.CalculateCaliper()
+
+    def PlotLengthVsDiameter(self, mode='auto'):
+        self.XYDataPlot(self.RawColumn('diameter'), self.RawColumn('length'), 
+                        'Diameter (mm)', 'Length (m)', 'Length vs. Diameter', 
+                        mode=mode, fit_xy=self.FitLinePoints('diameter'))
+
+    def PlotLengthVsDiamSquared(self, mode='auto'):
+        self.XYDataPlot(self.RawColumn('diam_m^2'), self.RawColumn('length'), 
+                        'Diameter Squared (m^2)', 'Length (m)', 
+                        'Length vs. Diameter Squared', mode=mode, 
+                        fit_xy=self.FitLinePoints('diam_m^2'))
 
     """
     =========================================================================
     Plot raw and transformed data
     =========================================================================
     """
-    def PlotRawAndTransformedData(self):
+    def PlotRawAndTransformedData(self, mode='auto'):
+        """
+        Plot raw and transformed data with the fitted line overlaid (if
+        FitRawData has run). mode is 'auto' (strategy by point count),
+        'scatter', 'decimate' or 'density' -- see plotdata.py
+        """
         text = 'Diameter (mm)', 'Length (m)', 'Length vs. Diameter'
-        self.XYDataPlot(self.df_raw['diameter'], self.df_raw['length'], 
-                        text[0],  text[1], text[2])
+        self.XYDataPlot(self.RawColumn('diameter'), self.RawColumn('length'), 
+                        text[0],  text[1], text[2], mode=mode, 
+                        fit_xy=self.FitLinePoints('diameter'))
 
         text = 'Diameter Squared (m^2)', 'Length (m)', 'Length vs. Diameter Squared'
-        self.XYDataPlot(self.df_raw['diam_m^2'], self.df_raw['length'], 
-                        text[0],  text[1], text[2]) 
+        self.XYDataPlot(self.RawColumn('diam_m^2'), self.RawColumn('length'), 
+                        text[0],  text[1], text[2], mode=mode, 
+                        fit_xy=self.FitLinePoints('diam_m^2'))
+
+    def FitLinePoints(self, col_x, n_points=200):
+        """
+        X, Y points of the fitted line over col_x's data range, or None
+        if not yet fit. For col_x 'diameter' [mm], the line in diam_m^2 is
+        a parabola in diameter
+        """
+        if self.slope is None: return None
+        values = self.RawColumn(col_x)
+        x = np.linspace(np.nanmin(values), np.nanmax(values), n_points)
+        diam_m2 = (x / 1000) ** 2 if col_x == 'diameter' else x
+        return x, self.slope * diam_m2 + self.intercept
 
 
     """
@@ -144,19 +367,142 @@ class RollLength:
     """
     @property
     def CalculateLength(self):
-        self.CalculateLengthProcedure()
+        """
+        Returns length; memoized per instance until diam_roll, diam_core or
+        caliper change. Identical inputs across instances are served from 
+        the process-wide LRU (see LengthCacheInfo)
+
+        Instance memo hits are plain attribute reads and are not recorded
+        by the instrument registry; each refresh is (CachedLengthLookup)
+        """
+        key = (self.diam_roll, self.diam_core, self.caliper)
+        if self.key_length != key: self.CachedLengthLookup(key)
         return self.length
+
+    @Instrumented
+    def CachedLengthLookup(self, key):
+        """
+        Set length from the process-wide LRU (an LRU miss calculates it)
+        """
+        self.length = CachedLength(*key)
+        self.key_length = key
     
+    @Instrumented
     def CalculateLengthProcedure(self):
         """
         Calculate roll length in meters
         JDL 4/27/23; modified 5/1/23
+        Shares the vectorized formula with CalculateLengthArray so scalar
+        and batch results are identical
+        """
+        CheckLengthInputs(self.diam_roll, self.diam_core, self.caliper)
+        length = self.CalculateLengthArray(self.diam_roll, self.diam_core, 
+                                           self.caliper)
+        self.length = float(length)
+        self.key_length = (self.diam_roll, self.diam_core, self.caliper)
+
+    """
+    =========================================================================
+    Batch length calculation - vectorized over arrays of rolls. 
+
+    Same units and rounding as CalculateLengthProcedure
+    =========================================================================
+    """
+    @staticmethod
+    def CalculateLengthArray(diam_roll, diam_core, caliper):
+        """
+        Calculate roll lengths [m] in one broadcasted pass
+
+        Args:
+        diam_roll (float or array-like): Roll diameter(s) [mm]
+        diam_core (float or array-like): Core diameter(s) [mm]
+        caliper (float or array-like): Substrate thickness(es) [mm]
+
+        Returns: ndarray of lengths rounded to 0.1 m (0-d for scalar inputs)
+        """
+        mm_m = 1000.
+        diam_roll = np.asarray(diam_roll, dtype=np.float64)
+        diam_core = np.asarray(diam_core, dtype=np.float64)
+        caliper = np.asarray(caliper, dtype=np.float64)
+
+        numerator = np.pi * ((diam_roll / mm_m) ** 2 - 
+                             (diam_core / mm_m) ** 2)
+        denom = (4 * (caliper / mm_m))
+        return np.round(numerator / denom, 1)
+
+    @staticmethod
+    def CalculateDiameterArray(length, diam_core, caliper):
+        """
+        Inverse of CalculateLengthArray: roll diameter(s) [mm] that hold a
+        target length [m] on a core [mm] for a caliper [mm]. Not rounded
         """
         mm_m = 1000.
-        numerator = math.pi * ((self.diam_roll / mm_m) ** 2 - 
-                               (self.diam_core / mm_m) ** 2)
-        denom = (4 * (self.caliper / mm_m))
-        self.length = round(numerator / denom, 1)
+        length = np.asarray(length, dtype=np.float64)
+        diam_core = np.asarray(diam_core, dtype=np.float64)
+        caliper = np.asarray(caliper, dtype=np.float64)
+
+        diam_m2 = (diam_core / mm_m) ** 2 + 4 * (caliper / mm_m) * length / np.pi
+        return np.sqrt(diam_m2) * mm_m
+
+    @staticmethod
+    def CalculateCaliperArray(length, diam_roll, diam_core):
+        """
+        Inverse of CalculateLengthArray: caliper(s) [mm] implied by measured
+        length [m] and diameters [mm]. Rounded to 4 decimals like 
+        CalculateCaliper; non-positive lengths give NaN
+        """
+        mm_m = 1000.
+        length = np.asarray(length, dtype=np.float64)
+        diam_roll = np.asarray(diam_roll, dtype=np.float64)
+        diam_core = np.asarray(diam_core, dtype=np.float64)
+
+        numerator = np.pi * ((diam_roll / mm_m) ** 2 - 
+                             (diam_core / mm_m) ** 2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            caliper = np.where(length > 0, numerator / (4 * length), np.nan)
+        return np.round(caliper * mm_m, 4)
+
+    @classmethod
+    def CalculateLengthBatch(cls, df, col_roll='diam_roll', 
+                             col_core='diam_core', col_caliper='caliper'):
+        """
+        Calculate lengths [m] for a DataFrame with one row per roll
+
+        Args:
+        df (DataFrame): Roll table with diameter and caliper columns [mm]
+        col_roll, col_core, col_caliper (string, optional): column names
+
+        Returns: Series of lengths named 'length' and aligned to df.index
+        """
+        import pandas as pd
+        lengths = cls.CalculateLengthArray(df[col_roll].values, 
+                                           df[col_core].values, 
+                                           df[col_caliper].values)
+        return pd.Series(lengths, index=df.index, name='length')
+
+    """
+    =========================================================================
+    Memoization utilities
+    =========================================================================
+    """
+    def Invalidate(self):
+        """
+        Force CaliperFromRawData and CalculateLength to rerun on next read
+        (e.g. after file_raw's contents change on disk)
+        """
+        self.key_caliper = None
+        self.key_length = None
+
+    @staticmethod
+    def LengthCacheInfo():
+        """
+        Hits, misses, maxsize and currsize of the process-wide length LRU
+        """
+        return CachedLength.cache_info()
+
+    @staticmethod
+    def ClearLengthCache():
+        CachedLength.cache_clear()
 
     """
     =========================================================================
@@ -164,12 +510,48 @@ class RollLength:
     =========================================================================
     """
     @staticmethod
-    def XYDataPlot(X, Y, x_label, y_label, plot_title):
+    def XYDataPlot(X, Y, x_label, y_label, plot_title, mode='auto', 
+                   fit_xy=None, ax=None):
         """
         XY Plot of raw and transformed data
+
+        Large data is decimated or density-binned per mode (see 
+        plotdata.PlotData). fit_xy (X, Y) overlays a fitted line. If ax is
+        None, draws on the current pyplot Axes and calls plt.show()
         """
-        plt.scatter(X, Y)
-        plt.xlabel(x_label), plt.ylabel(y_label)
-        plt.title(plot_title)
-        plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-        plt.show()
\ No newline at end of file
+        from plotdata import PlotData
+        IsShow = ax is None
+        if IsShow:
+            import matplotlib.pyplot as plt
+            ax = plt.gca()
+
+        PlotData.Draw(ax, np.asarray(X), np.asarray(Y), mode)
+        if fit_xy is not None:
+            ax.plot(fit_xy[0], fit_xy[1], color='red', label='Linear fit')
+            ax.legend()
+        ax.set_xlabel(x_label), ax.set_ylabel(y_label)
+        ax.set_title(plot_title)
+        ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+        if IsShow: plt.show()
+        return ax
+
+
+@functools.lru_cache(maxsize=65536)
+def CachedLength(diam_roll, diam_core, caliper):
+    """
+    Process-wide LRU of scalar lengths [m] keyed by (diam_roll, diam_core,
+    caliper) in mm. Invalid inputs raise, so they are never cached
+    """
+    CheckLengthInputs(diam_roll, diam_core, caliper)
+    return float(RollLength.CalculateLengthArray(diam_roll, diam_core, caliper))
+
+def CheckLengthInputs(diam_roll, diam_core, caliper):
+    """
+    Raise ValueError for a missing scalar length input or a non-positive
+    caliper (the array path returns NaN or inf for these instead)
+    """
+    for name, value in (('diam_roll', diam_roll), ('diam_core', diam_core),
+                        ('caliper', caliper)):
+        if value is None: raise ValueError(f"{name} is required for length.")
+    if not caliper > 0:
+        raise ValueError(f"caliper must be positive, got {caliper}.")
@@ -0,0 +1,153 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import numpy as np
+from roll2 import RollLength
+
+
+class RollBatch:
+    """
+    Struct-of-arrays collection of rolls -- one NumPy column per RollLength
+    attribute instead of one object per roll. Columns that were never set
+    are None and cost nothing, so a batch of diameters and calipers costs
+    3 * itemsize bytes per roll (plus 8 for length once calculated)
+
+    Attribute names and the CalculateLength/CalculateCaliper procedures
+    mirror RollLength but operate on whole columns
+    """
+    __slots__ = ('diam_roll', 'diam_core', 'caliper', 'length', 'slope',
+                 'intercept', 'R_squared', 'dtype')
+    COLUMNS = ('diam_roll', 'diam_core', 'caliper', 'length', 'slope',
+               'intercept', 'R_squared')
+
+    #Always float64: float32 can't hold lengths like 12345.6 m exactly, so
+    #it would undo the 0.1 m rounding
+    FLOAT64_COLUMNS = ('length',)
+
+    def __init__(self, diam_roll=None, diam_core=None, caliper=None,
+                 slope=None, dtype=np.float64, **cols):
+        """
+        Args:
+        diam_roll, diam_core, caliper (float or array-like, optional): Roll
+            inputs in mm (scalars broadcast to the batch length)
+        slope (array-like, optional): Raw data fit slopes for caliper calc
+        dtype (numpy dtype, optional): Column dtype; np.float32 halves memory
+            (except FLOAT64_COLUMNS)
+        cols: Any other column in COLUMNS (length, intercept, R_squared)
+        """
+        self.dtype = np.dtype(dtype)
+        cols.update(diam_roll=diam_roll, diam_core=diam_core, caliper=caliper,
+                    slope=slope)
+        unknown = set(cols) - set(self.COLUMNS)
+        if unknown: raise ValueError(f"Unknown RollBatch columns: {unknown}")
+
+        given = {k: np.asarray(v, dtype=self.ColumnDtype(k)) 
+                 for k, v in cols.items() if v is not None}
+        arrays = np.broadcast_arrays(*given.values()) if given else []
+        for name in self.COLUMNS: setattr(self, name, None)
+        for name, arr in zip(given, arrays):
+            setattr(self, name, np.ascontiguousarray(arr).reshape(-1))
+
+    @classmethod
+    def FromDataFrame(cls, df, dtype=np.float64):
+        """
+        Instance from a DataFrame whose columns are named like COLUMNS
+        """
+        cols = {c: df[c].values for c in cls.COLUMNS if c in df.columns}
+        return cls(dtype=dtype, **cols)
+
+    @classmethod
+    def FromRolls(cls, rolls, dtype=np.float64):
+        """
+        Instance from a list of RollLength objects (None attributes -> NaN)
+        """
+        def Col(name):
+            vals = [getattr(r, name) for r in rolls]
+            if all(v is None for v in vals): return None
+            return [np.nan if v is None else v for v in vals]
+        return cls(dtype=dtype, **{c: Col(c) for c in cls.COLUMNS})
+
+    """
+    =========================================================================
+    CalculateLength and CalculateCaliper procedures (vectorized)
+    =========================================================================
+    """
+    @property
+    def CalculateLength(self):
+        self.CalculateLengthProcedure()
+        return self.length
+
+    def CalculateLengthProcedure(self):
+        """
+        Roll lengths [m] for all rolls (same formula and rounding as
+        RollLength.CalculateLengthProcedure)
+        """
+        self.length = RollLength.CalculateLengthArray(self.diam_roll,
+                                                      self.diam_core, 
+                                                      self.caliper)
+
+    def ColumnDtype(self, name):
+        return np.dtype(np.float64) if name in self.FLOAT64_COLUMNS else \
+            self.dtype
+
+    @property
+    def CalculateCaliper(self):
+        self.CalculateCaliperProcedure()
+        return self.caliper
+
+    def CalculateCaliperProcedure(self):
+        """
+        Caliper [mm] from the slope column as in RollLength.CalculateCaliper
+        """
+        if self.slope is None:
+            raise ValueError("No slope column available to calculate caliper.")
+        caliper = np.round(np.pi / (4 * self.slope.astype(np.float64)) * 1000, 4)
+        self.caliper = caliper.astype(self.dtype)
+
+    """
+    =========================================================================
+    Container methods - slicing, filtering and export
+    =========================================================================
+    """
+    def __len__(self):
+        for name in self.COLUMNS:
+            arr = getattr(self, name)
+            if arr is not None: return arr.size
+        return 0
+
+    def __getitem__(self, idx):
+        """
+        Integer index returns a RollLength; slices, boolean masks and index
+        arrays return a new RollBatch (slices are views, not copies)
+        """
+        if isinstance(idx, (int, np.integer)):
+            roll = RollLength()
+            for name in self.COLUMNS:
+                arr = getattr(self, name)
+                if arr is not None: setattr(roll, name, arr[idx].item())
+            return roll
+
+        batch = RollBatch.__new__(RollBatch)
+        batch.dtype = self.dtype
+        for name in self.COLUMNS:
+            arr = getattr(self, name)
+            setattr(batch, name, None if arr is None else arr[idx])
+        return batch
+
+    def Filter(self, mask):
+        """
+        Rolls where the boolean mask (e.g. batch.length > 50) is True
+        """
+        return self[np.asarray(mask, dtype=bool)]
+
+    def ToDataFrame(self):
+        import pandas as pd
+        return pd.DataFrame({c: getattr(self, c) for c in self.COLUMNS
+                             if getattr(self, c) is not None})
+
+    @property
+    def nbytes(self):
+        """
+        Bytes held by allocated columns
+        """
+        return sum(getattr(self, c).nbytes for c in self.COLUMNS
+                   if getattr(self, c) is not None)
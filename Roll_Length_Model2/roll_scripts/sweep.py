@@ -0,0 +1,129 @@
+#Version 10/17/26
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+import os, time
+import numpy as np
+from roll2 import RollLength
+
+#Grid axes in output column order
+AXES = ['diam_roll', 'diam_core', 'caliper']
+
+
+class ParameterSweep:
+    def __init__(self, diam_roll, diam_core, caliper, tile_size=10**6,
+                 length_min=None, length_max=None):
+        """
+        Roll length over the full grid diam_roll x diam_core x caliper
+
+        The grid is never materialized: it is evaluated tile by tile (flat
+        grid index ranges of tile_size points) with the vectorized
+        RollLength.CalculateLengthArray, and kept rows are streamed to CSV or
+        Parquet, so memory is bounded by tile_size for any grid size
+
+        Usage: ParameterSweep(np.linspace(100, 200, 1001), [38.1, 76.2],
+            np.arange(0.3, 0.7, 0.001), length_min=500).Run('sweep.csv')
+
+        Args:
+        diam_roll, diam_core, caliper (float or array-like): Axis values [mm]
+        tile_size (int, optional): Grid points evaluated per tile
+        length_min, length_max (float, optional): Keep only rows with length
+            [m] in this band (inclusive); None leaves that side open
+        """
+        self.axes = [np.atleast_1d(np.asarray(a, dtype=np.float64)).ravel()
+                     for a in (diam_roll, diam_core, caliper)]
+        self.shape = tuple(a.size for a in self.axes)
+        self.n_grid = int(np.prod(self.shape))
+        self.tile_size = tile_size
+        self.length_min = length_min
+        self.length_max = length_max
+
+        self.stats = None #Row counts, elapsed seconds and rows_per_sec
+
+    """
+    =========================================================================
+    Tiles
+    =========================================================================
+    """
+    def IterTiles(self):
+        """
+        Yield a dict of column arrays (AXES plus length) per tile, holding
+        only rows with a positive length inside the band
+        """
+        for start in range(0, self.n_grid, self.tile_size):
+            stop = min(start + self.tile_size, self.n_grid)
+            idx = np.unravel_index(np.arange(start, stop), self.shape)
+            tile = {c: a[i] for c, a, i in zip(AXES, self.axes, idx)}
+            with np.errstate(divide='ignore', invalid='ignore'):
+                length = RollLength.CalculateLengthArray(**tile)
+            keep = np.isfinite(length) & (length > 0)
+            if self.length_min is not None: keep &= length >= self.length_min
+            if self.length_max is not None: keep &= length <= self.length_max
+            tile['length'] = length
+            yield {c: v[keep] for c, v in tile.items()}
+
+    """
+    =========================================================================
+    Run Procedure
+    =========================================================================
+    """
+    def Run(self, pf_out=None):
+        """
+        Evaluate the grid and stream kept rows to pf_out (.csv or .parquet;
+        None only counts rows). Returns stats dict
+        """
+        time_start = time.perf_counter()
+        n_rows = 0
+        writer = self.Writer(pf_out) if pf_out else None
+        try:
+            for tile in self.IterTiles():
+                n_rows += tile['length'].size
+                if writer is not None: writer(tile)
+        finally:
+            if writer is not None: writer.close()
+
+        #Throughput counts every grid point evaluated, kept or not
+        seconds = time.perf_counter() - time_start
+        self.stats = {'n_grid': self.n_grid, 'n_rows': n_rows,
+                      'seconds': seconds,
+                      'rows_per_sec': self.n_grid / seconds if seconds else
+                          float('inf')}
+        return self.stats
+
+    def Writer(self, pf_out):
+        """
+        Callable that appends one tile to pf_out and has a close() method.
+        Parquet needs pyarrow (imported only when used)
+        """
+        ext = os.path.splitext(pf_out)[1].lower()
+        if ext == '.parquet': return ParquetTileWriter(pf_out)
+        if ext == '.csv': return CsvTileWriter(pf_out)
+        raise ValueError(f"Unsupported sweep output type: {ext}")
+
+
+class CsvTileWriter:
+    def __init__(self, pf_out):
+        self.f = open(pf_out, 'w', newline='')
+        self.f.write(','.join(AXES + ['length']) + '\n')
+
+    def __call__(self, tile):
+        if tile['length'].size == 0: return
+        block = np.column_stack([tile[c] for c in AXES + ['length']])
+        np.savetxt(self.f, block, delimiter=',', fmt='%.10g')
+
+    def close(self):
+        self.f.close()
+
+
+class ParquetTileWriter:
+    def __init__(self, pf_out):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa = pa
+        self.schema = pa.schema([(c, pa.float64()) for c in AXES + ['length']])
+        self.writer = pq.ParquetWriter(pf_out, self.schema)
+
+    def __call__(self, tile):
+        if tile['length'].size == 0: return
+        self.writer.write_table(self.pa.Table.from_pydict(tile, self.schema))
+
+    def close(self):
+        self.writer.close()
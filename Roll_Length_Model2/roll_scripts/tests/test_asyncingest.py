@@ -0,0 +1,83 @@
+#Version 10/17/26
+#python -m pytest test_asyncingest.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os, asyncio
+import pandas as pd
+import numpy as np
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from asyncingest import AsyncIngest
+
+@pytest.fixture()
+def lst_files(tmp_path):
+    """
+    A two-sheet workbook (one roll per sheet), a .csv and a missing file
+    """
+    pf_xlsx = str(tmp_path / 'lab_batch.xlsx')
+    with pd.ExcelWriter(pf_xlsx) as writer:
+        pd.DataFrame({'length': [10., 20.], 'diameter': [80., 120.]}
+                     ).to_excel(writer, sheet_name='roll_1', index=False)
+        pd.DataFrame({'length': [5., 15., 25.], 'diameter': [70., 100., 125.]}
+                     ).to_excel(writer, sheet_name='roll_2', index=False)
+    pf_csv = str(tmp_path / 'roll_3.csv')
+    pd.DataFrame({'length': [10., 20.], 'diameter': [80., 120.]}
+                 ).to_csv(pf_csv, index=False)
+    return [pf_xlsx, pf_csv, str(tmp_path / 'missing.xlsx')]
+
+def test_IterTables(lst_files):
+    """
+    Every sheet is yielded once; unreadable files are reported
+    """
+    async def Collect():
+        return [item async for item in AsyncIngest(lst_files).IterTables()]
+    items = asyncio.run(Collect())
+    keys = sorted((os.path.basename(i['file_raw']), str(i['sheet']))
+                  for i in items)
+    assert keys == [('lab_batch.xlsx', 'roll_1'), ('lab_batch.xlsx', 'roll_2'),
+                    ('missing.xlsx', 'None'), ('roll_3.csv', 'None')]
+    missing = [i for i in items if 'missing' in i['file_raw']][0]
+    assert missing['df_raw'] is None and missing['error']
+
+@pytest.mark.parametrize('IsProcessPool', [False, True])
+def test_FitAll(lst_files, IsProcessPool):
+    df = AsyncIngest(lst_files, max_workers=2, IsProcessPool=IsProcessPool
+                     ).Run()
+    assert list(df['sheet'].fillna('')) == ['roll_1', 'roll_2', '', '']
+    assert list(df['n_rows']) == [2, 3, 0, 2]
+    assert df.loc[0, 'caliper'] == df.loc[3, 'caliper']
+    assert np.isnan(df.loc[2, 'caliper'])
+    assert df.loc[2, 'error'].startswith('FileNotFoundError')
+
+def test_IterTables_backpressure(tmp_path, monkeypatch):
+    """
+    With a slow consumer, parsed-but-unconsumed tables stay bounded by
+    2 * max_workers (plus the one being consumed)
+    """
+    lst_files = []
+    for i in range(20):
+        pf = str(tmp_path / f'roll_{i}.csv')
+        pd.DataFrame({'length': [10., 20.], 'diameter': [80., 120.]}
+                     ).to_csv(pf, index=False)
+        lst_files.append(pf)
+
+    counts = {'parsed': 0, 'consumed': 0, 'max_ahead': 0}
+    read = AsyncIngest.ReadSheet
+    def ReadSheet(file_raw, sheet):
+        df = read(file_raw, sheet)
+        counts['parsed'] += 1
+        counts['max_ahead'] = max(counts['max_ahead'],
+                                  counts['parsed'] - counts['consumed'])
+        return df
+    monkeypatch.setattr(AsyncIngest, 'ReadSheet', staticmethod(ReadSheet))
+
+    async def Consume():
+        async for item in AsyncIngest(lst_files, max_workers=2).IterTables():
+            await asyncio.sleep(0.01)
+            counts['consumed'] += 1
+    asyncio.run(Consume())
+    assert counts['consumed'] == 20
+    assert counts['max_ahead'] <= 2 * 2 + 1
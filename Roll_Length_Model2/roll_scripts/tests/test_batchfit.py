@@ -0,0 +1,61 @@
+#Version 10/17/26
+#python -m pytest test_batchfit.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os, shutil
+import pandas as pd
+import numpy as np
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from batchfit import BatchFitter
+
+@pytest.fixture()
+def path_rawdata(tmp_path):
+    """
+    raw_data folder with two good files, one bad file and a non-raw file
+    """
+    shutil.copy(os.path.join(current_dir, 'df_raw_validation.xlsx'), 
+                tmp_path / 'roll_a.xlsx')
+    pd.DataFrame({'length': [10., 20., 30.], 'diameter': [80., 100., 120.]}
+                 ).to_csv(tmp_path / 'roll_b.csv', index=False)
+    pd.DataFrame({'x': [1, 2]}).to_csv(tmp_path / 'roll_bad.csv', index=False)
+    (tmp_path / 'notes.txt').write_text('not raw data')
+    return str(tmp_path)
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_FitAll(path_rawdata, max_workers):
+    """
+    One results row per raw file; failures reported, not raised
+    """
+    df = BatchFitter(path_rawdata, max_workers=max_workers).FitAll()
+    assert [os.path.basename(f) for f in df['file_raw']] == \
+        ['roll_a.xlsx', 'roll_b.csv', 'roll_bad.csv']
+
+    row_a = df.iloc[0]
+    assert row_a['caliper'] == pytest.approx(0.5027, abs=1e-4)
+    assert row_a['R_squared'] == pytest.approx(1.0)
+    assert row_a['error'] == ''
+
+    assert df.iloc[1]['n_rows'] == 3
+    assert df.iloc[2]['error'].startswith('KeyError')
+    assert np.isnan(df.iloc[2]['caliper'])
+
+def test_FitAll_validate(path_rawdata):
+    """
+    Quality columns are reported per file; a bad row in a file is dropped
+    """
+    pd.DataFrame({'length': [10., 20., 20., 30.], 
+                  'diameter': [80., 100., 100., 120.]}
+                 ).to_csv(os.path.join(path_rawdata, 'roll_b.csv'), index=False)
+    df = BatchFitter(path_rawdata, max_workers=1, IsValidate=True).FitAll()
+    assert list(df.columns[-7:]) == ['n_nan', 'n_non_positive', 
+        'n_non_monotonic', 'n_duplicate', 'n_valid', 'IsValid', 'error']
+    row_b = df.iloc[1]
+    assert (row_b['n_rows'], row_b['n_duplicate'], row_b['n_valid']) == \
+        (4, 1, 3)
+    assert not row_b['IsValid']
+    assert df.iloc[0]['IsValid'] and df.iloc[0]['error'] == ''
+    assert df.iloc[2]['error'].startswith('KeyError')
@@ -0,0 +1,69 @@
+#Version 10/17/26
+#python -m pytest test_bench_roll2.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os, json
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from bench_roll2 import BenchmarkSuite, main
+
+def test_RunAll_and_JSON(tmp_path):
+    """
+    Smoke run at small size records every step and round-trips JSON
+    """
+    suite = BenchmarkSuite(sizes=(100,), repeat=1, path_work=str(tmp_path))
+    results = suite.RunAll()
+    steps = [r['step'] for r in results]
+    assert steps == ['ReadRawData', 'AddCalculatedRawCols', 'FitRawData',
+                     'CaliperFromRawDataProcedure', 'CalculateLength']
+    assert all(r['time_s'] >= 0 and r['peak_bytes'] > 0 for r in results)
+
+    pf = str(tmp_path / 'bench.json')
+    suite.ToJSON(pf)
+    assert BenchmarkSuite.LoadJSON(pf)['results'] == results
+
+def test_TimeStep_setup():
+    """
+    setup runs before every timed and traced call but is not measured
+    """
+    calls = []
+    suite = BenchmarkSuite(repeat=2)
+    result = suite.TimeStep('step', 1, lambda: calls.append('func'),
+                            setup=lambda: calls.append(bytearray(10**7)))
+    assert len(calls) == 6 and calls[1::2] == ['func'] * 3
+    assert result['peak_bytes'] < 10**6
+
+def test_CompareToBaseline():
+    """
+    Only steps slower or using more peak memory than baseline by more than
+    tolerance are flagged
+    """
+    suite = BenchmarkSuite()
+    suite.results = [
+        {'step': 'FitRawData', 'n': 10, 'time_s': 2.0, 'peak_bytes': 100},
+        {'step': 'ReadRawData', 'n': 10, 'time_s': 1.1, 'peak_bytes': 300},
+        {'step': 'CalculateLength', 'n': 10, 'time_s': 9.0}]
+    baseline = {'results': [
+        {'step': 'FitRawData', 'n': 10, 'time_s': 1.0, 'peak_bytes': 100},
+        {'step': 'ReadRawData', 'n': 10, 'time_s': 1.0, 'peak_bytes': 200}]}
+    regressions = suite.CompareToBaseline(baseline, tolerance=0.25)
+    assert [(r['step'], r['metric']) for r in regressions] == \
+        [('FitRawData', 'time_s'), ('ReadRawData', 'peak_bytes')]
+    assert regressions[0]['ratio'] == pytest.approx(2.0)
+    assert regressions[1]['ratio'] == pytest.approx(1.5)
+
+def test_main_exit_code(tmp_path):
+    """
+    CLI writes JSON and returns 1 when a regression is flagged
+    """
+    pf_base = str(tmp_path / 'base.json')
+    assert main(['--sizes', '100', '--repeat', '1', '--out', pf_base]) == 0
+    base = BenchmarkSuite.LoadJSON(pf_base)
+    for r in base['results']: r['time_s'] = 1e-12
+    with open(pf_base, 'w') as f: json.dump(base, f)
+    pf_new = str(tmp_path / 'new.json')
+    assert main(['--sizes', '100', '--repeat', '1', '--out', pf_new,
+                 '--baseline', pf_base]) == 1
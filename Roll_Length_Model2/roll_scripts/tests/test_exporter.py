@@ -0,0 +1,79 @@
+#Version 10/17/26
+#python -m pytest test_exporter.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from exporter import ResultExporter
+from resultstore import ResultStore
+from sweep import ParameterSweep
+
+@pytest.fixture()
+def df_lengths():
+    n = 2500
+    df = pd.DataFrame({'case_study': ['A'] * n,
+                       'diam_roll': np.linspace(60., 200., n),
+                       'diam_core': 43.2, 'caliper': 0.47})
+    df['length'] = np.round(df['diam_roll'] / 10, 1)
+    df.loc[7, 'length'] = np.nan
+    return df
+
+def test_Export_excel_sheets(df_lengths, tmp_path):
+    """
+    Rows beyond max_sheet_rows continue on numbered sheets with a header;
+    missing values are written as empty cells
+    """
+    pf = str(tmp_path / 'results.xlsx')
+    exporter = ResultExporter(chunk_size=300, max_sheet_rows=1001)
+    assert exporter.Export(df_lengths, pf) == 2500
+
+    dict_sheets = pd.read_excel(pf, sheet_name=None)
+    assert list(dict_sheets) == ['results', 'results_2', 'results_3']
+    assert [len(df) for df in dict_sheets.values()] == [1000, 1000, 500]
+    df = pd.concat(dict_sheets.values(), ignore_index=True)
+    pd.testing.assert_frame_equal(df, df_lengths)
+
+def test_Export_csv_chunks(df_lengths, tmp_path):
+    """
+    Chunked CSV equals one pandas write, from a DataFrame or from chunks
+    """
+    pf = str(tmp_path / 'results.csv')
+    exporter = ResultExporter(chunk_size=700)
+    assert exporter.Export(df_lengths, pf) == 2500
+    pd.testing.assert_frame_equal(pd.read_csv(pf), df_lengths)
+
+    chunks = [df_lengths.iloc[:1000], df_lengths.iloc[1000:]]
+    exporter.Export(iter(chunks), pf)
+    pd.testing.assert_frame_equal(pd.read_csv(pf), df_lengths)
+
+def test_Export_from_store_and_sweep(df_lengths, tmp_path):
+    """
+    Streams ResultStore query chunks and ParameterSweep tiles
+    """
+    pf = str(tmp_path / 'lengths.csv')
+    with ResultStore(str(tmp_path / 'results.db')) as store:
+        store.InsertLengths(df_lengths)
+        n = ResultExporter().Export(store.IterQuery('lengths', 400), pf)
+    assert n == 2500
+    assert np.allclose(pd.read_csv(pf)['diam_roll'], df_lengths['diam_roll'])
+
+    sweep = ParameterSweep([100., 120.], 43.2, [0.4, 0.5], tile_size=3)
+    assert ResultExporter().Export(sweep.IterTiles(), pf) == 4
+    assert list(pd.read_csv(pf).columns) == ['diam_roll', 'diam_core',
+                                             'caliper', 'length']
+
+def test_Export_parquet(df_lengths, tmp_path):
+    pytest.importorskip('pyarrow')
+    pf = str(tmp_path / 'results.parquet')
+    ResultExporter(chunk_size=1000).Export(df_lengths, pf)
+    pd.testing.assert_frame_equal(pd.read_parquet(pf), df_lengths)
+
+def test_Export_unsupported(df_lengths, tmp_path):
+    with pytest.raises(ValueError):
+        ResultExporter().Export(df_lengths, str(tmp_path / 'results.txt'))
@@ -0,0 +1,181 @@
+#Version 10/17/26
+#python -m pytest test_fitstats.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from fitstats import BootstrapFit, LinearFitStats, RobustLinearFit
+
+@pytest.fixture()
+def xy_noisy():
+    """
+    Noisy length [m] vs. diam_m^2 data resembling an unwound roll
+    """
+    rng = np.random.default_rng(7)
+    x = rng.uniform(0.002, 0.015, 1000)
+    y = 2000. * x - 3. + rng.normal(0., 0.5, x.size)
+    return x, y
+
+def test_FromArrays_matches_sklearn(xy_noisy):
+    """
+    Closed-form fit matches scikit-learn's LinearRegression within tolerance
+    """
+    linear_model = pytest.importorskip('sklearn.linear_model')
+    x, y = xy_noisy
+    stats = LinearFitStats.FromArrays(x, y)
+
+    reg = linear_model.LinearRegression().fit(x.reshape(-1, 1), y)
+    assert np.isclose(stats.slope, reg.coef_[0])
+    assert np.isclose(stats.intercept, reg.intercept_)
+    assert np.isclose(stats.R_squared, reg.score(x.reshape(-1, 1), y))
+
+def test_FromArrays_large_offset():
+    """
+    Shifted sums keep precision when x carries a large constant offset
+    """
+    x = 1e6 + np.arange(10.)
+    y = 3. * np.arange(10.) + 1.
+    stats = LinearFitStats.FromArrays(x, y)
+    assert np.isclose(stats.slope, 3.)
+    assert np.isclose(stats.R_squared, 1.)
+
+def test_CalculateFit_errors():
+    """
+    Too few points or zero spread in x cannot be fit
+    """
+    with pytest.raises(ValueError):
+        LinearFitStats.FromArrays([1.], [2.])
+    with pytest.raises(ValueError):
+        LinearFitStats.FromArrays([1., 1.], [2., 3.])
+    with pytest.raises(ValueError):
+        LinearFitStats().Update([1., 2.], [1.])
+
+def test_Update_chunks_and_Merge(xy_noisy):
+    """
+    Chunked updates and merged partial sums reproduce the one-pass fit
+    """
+    x, y = xy_noisy
+    expected = LinearFitStats.FromArrays(x, y).CalculateFit()
+
+    chunked = LinearFitStats()
+    for i in range(0, x.size, 128): chunked.Update(x[i:i+128], y[i:i+128])
+    assert np.allclose(chunked.CalculateFit(), expected)
+
+    part1, part2 = LinearFitStats(), LinearFitStats()
+    part1.Update(x[:300], y[:300])
+    part2.Update(x[300:] + 0., y[300:])
+    part1.Merge(part2)
+    assert part1.n == x.size
+    assert np.allclose(part1.CalculateFit(), expected)
+
+"""
+=========================================================================
+RobustLinearFit
+=========================================================================
+"""
+def test_RobustLinearFit_glitches(xy_noisy):
+    """
+    Glitched readings are rejected and barely move the slope
+    """
+    x, y = xy_noisy
+    y = y.copy()
+    idx_glitch = np.arange(0, x.size, 50)
+    y[idx_glitch] += 500.
+
+    ols = LinearFitStats.FromArrays(x, y)
+    fit = RobustLinearFit()
+    fit.Fit(x, y)
+    assert abs(fit.slope - 2000.) < 0.01 * 2000.
+    assert abs(ols.slope - 2000.) > abs(fit.slope - 2000.)
+    assert fit.outliers[idx_glitch].all()
+    assert fit.outliers.sum() == idx_glitch.size
+    assert fit.R_squared > 0.99
+
+def test_RobustLinearFit_sampled_pairs(xy_noisy):
+    """
+    Sampled Theil-Sen start gives the same answer as all pairs
+    """
+    x, y = xy_noisy
+    full = RobustLinearFit(n_pairs=10**6).Fit(x, y)
+    sampled = RobustLinearFit(n_pairs=2000, seed=1).Fit(x, y)
+    assert np.allclose(full, sampled)
+
+"""
+=========================================================================
+BootstrapFit
+=========================================================================
+"""
+def test_BootstrapFit_interval(xy_noisy):
+    """
+    Interval brackets the OLS fit, narrows with a lower ci level and
+    matches an explicit index-resampling loop
+    """
+    x, y = xy_noisy
+    ols = LinearFitStats.FromArrays(x, y)
+    boot = BootstrapFit(n_boot=400, seed=5)
+    ci = boot.Fit(x, y)
+    assert ci['slope'][0] < ols.slope < ci['slope'][1]
+    assert ci['intercept'][0] < ols.intercept < ci['intercept'][1]
+
+    ci_80 = BootstrapFit(n_boot=400, ci=80, seed=5).Fit(x, y)
+    assert ci_80['slope'][1] - ci_80['slope'][0] < \
+        ci['slope'][1] - ci['slope'][0]
+
+    #Each resample equals an ordinary fit of the duplicated points
+    rng = np.random.default_rng(np.random.SeedSequence(5).spawn(1)[0])
+    counts = rng.multinomial(x.size, np.full(x.size, 1 / x.size))
+    idx = np.repeat(np.arange(x.size), counts)
+    fit = LinearFitStats.FromArrays(x[idx], y[idx])
+    assert np.isclose(boot.slopes[0], fit.slope)
+    assert np.isclose(boot.intercepts[0], fit.intercept)
+
+def test_BootstrapFit_workers_reproducible(xy_noisy):
+    """
+    Same seed and memory cap give identical resamples in-process and on a
+    process pool; the cap splits the work into several batches
+    """
+    x, y = xy_noisy
+    max_bytes = 50 * x.size * 16
+    serial = BootstrapFit(n_boot=230, seed=2, max_bytes=max_bytes)
+    serial.Fit(x, y)
+    pooled = BootstrapFit(n_boot=230, seed=2, max_bytes=max_bytes,
+                          max_workers=2)
+    pooled.Fit(x, y)
+    assert serial.slopes.size == 230
+    assert np.array_equal(serial.slopes, pooled.slopes)
+    assert np.array_equal(serial.intercepts, pooled.intercepts)
+
+def test_BootstrapFit_memory_cap(xy_noisy):
+    """
+    Peak traced memory stays near max_bytes (draws plus float copy)
+    """
+    import tracemalloc
+    x, y = xy_noisy
+    max_bytes = 2**21
+    tracemalloc.start()
+    BootstrapFit(n_boot=2000, max_bytes=max_bytes).Fit(x, y)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 1.25 * max_bytes
+
+def test_Update_blocks_strided_float32():
+    """
+    Inputs spanning several blocks, float32 and strided (record array)
+    views fit the same as one float64 least squares solve
+    """
+    from fitstats import BLOCK_ROWS
+    rng = np.random.default_rng(4)
+    rec = np.zeros(2 * BLOCK_ROWS + 7, dtype=[('x', '<f4'), ('y', '<f4')])
+    rec['x'] = rng.uniform(0.002, 0.015, rec.size)
+    rec['y'] = 2000. * rec['x'] - 3. + rng.normal(0., 0.5, rec.size)
+    stats = LinearFitStats.FromArrays(rec['x'], rec['y'])
+    slope, intercept = np.polyfit(rec['x'].astype(np.float64),
+                                  rec['y'].astype(np.float64), 1)
+    assert stats.n == rec.size
+    assert np.isclose(stats.slope, slope, rtol=1e-9)
+    assert np.isclose(stats.intercept, intercept, rtol=1e-7)
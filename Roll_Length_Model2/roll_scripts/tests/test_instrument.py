@@ -0,0 +1,68 @@
+#Version 10/17/26
+#python -m pytest test_instrument.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os, json
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from instrument import registry
+from roll2 import RollLength
+
+@pytest.fixture()
+def reg():
+    """
+    Enabled, empty registry that is disabled again after the test
+    """
+    registry.Clear()
+    registry.Enable()
+    yield registry
+    registry.Disable()
+    registry.Clear()
+
+def test_disabled_records_nothing():
+    registry.Clear()
+    RollLength(diam_roll=120.5, diam_core=43.2, caliper=0.47
+               ).CalculateLengthProcedure()
+    assert registry.records == []
+
+def test_CaliperFromRawDataProcedure_steps(reg):
+    """
+    Each procedure step is recorded with time, rows and memory
+    """
+    roll = RollLength(file_raw=os.path.join(current_dir,
+                                            'df_raw_validation.xlsx'))
+    roll.CaliperFromRawDataProcedure()
+    steps = [r['step'].split('.')[1] for r in reg.records]
+    assert steps == ['ReadRawData', 'AddCalculatedRawCols', 'FitRawData',
+                     'CalculateCaliper', 'CaliperFromRawDataProcedure']
+    read, outer = reg.records[0], reg.records[-1]
+    assert read['rows'] == 2
+    assert read['peak_bytes'] > 0
+    assert outer['peak_bytes'] >= read['peak_bytes']
+    assert outer['wall_s'] >= read['wall_s']
+
+def test_Summary_and_ToJSON(reg, tmp_path):
+    for _ in range(3):
+        RollLength(diam_roll=120.5, diam_core=43.2, caliper=0.47
+                   ).CalculateLengthProcedure()
+    df = reg.Summary()
+    assert df.loc['RollLength.CalculateLengthProcedure', 'calls'] == 3
+
+    pf = str(tmp_path / 'steps.json')
+    reg.ToJSON(pf)
+    with open(pf) as f: assert len(json.load(f)) == 3
+
+def test_CalculateLength_property(reg):
+    """
+    Memo refreshes of the CalculateLength property are recorded; repeat
+    reads of an unchanged roll are not
+    """
+    roll = RollLength(diam_roll=120.5, diam_core=43.2, caliper=0.47)
+    assert roll.CalculateLength == roll.CalculateLength
+    roll.caliper = 0.5
+    roll.CalculateLength
+    steps = [r['step'] for r in reg.records]
+    assert steps == ['RollLength.CachedLengthLookup'] * 2
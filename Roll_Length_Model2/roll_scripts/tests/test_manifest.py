@@ -0,0 +1,78 @@
+#Version 10/17/26
+#python -m pytest test_manifest.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from manifest import Manifest
+
+@pytest.fixture()
+def path_proj(tmp_path):
+    """
+    Project with a data folder and two case studies' raw_data folders
+    """
+    (tmp_path / 'roll_data').mkdir()
+    (tmp_path / 'roll_data' / 'lookup.csv').write_text('a,b\n')
+    for case in ['case_a', 'case_b']:
+        path_raw = tmp_path / 'roll_case_studies' / case / 'raw_data'
+        path_raw.mkdir(parents=True)
+        (path_raw / f'{case}.csv').write_text(f'length,diameter\n{case}\n')
+    return tmp_path
+
+@pytest.fixture()
+def manifest(path_proj):
+    roots = [str(path_proj / 'roll_data')]
+    roots += [str(path_proj / 'roll_case_studies' / c / 'raw_data')
+              for c in ['case_a', 'case_b']]
+    return Manifest(roots, str(path_proj / 'manifest.json'), max_workers=2)
+
+def test_Update_changes(path_proj, manifest):
+    """
+    First run adds everything; later runs report only real changes
+    """
+    changes = manifest.Update()
+    assert len(changes['added']) == 3
+    assert os.path.isfile(manifest.pf_manifest)
+
+    path_raw_a = path_proj / 'roll_case_studies' / 'case_a' / 'raw_data'
+    path_raw_b = path_proj / 'roll_case_studies' / 'case_b' / 'raw_data'
+    (path_raw_a / 'case_a.csv').write_text('length,diameter\nnew\n')
+    os.utime(path_raw_b / 'case_b.csv', ns=(0, 0))
+    (path_proj / 'roll_data' / 'lookup.csv').unlink()
+    (path_raw_b / 'case_b2.csv').write_text('x')
+
+    changes = manifest.Update()
+    names = {k: [os.path.basename(p) for p in v] for k, v in changes.items()}
+    assert names == {'added': ['case_b2.csv'], 'changed': ['case_a.csv'],
+                     'removed': ['lookup.csv']}
+    assert [os.path.basename(p) for p in manifest.ChangedFiles()] == \
+        ['case_a.csv', 'case_b2.csv']
+
+    changes = Manifest(manifest.roots, manifest.pf_manifest).Update()
+    assert changes == {'added': [], 'changed': [], 'removed': []}
+
+def test_FromFiles(path_proj):
+    class FilesStub: pass
+    files = FilesStub()
+    files.path_root = str(path_proj) + os.sep
+    files.path_data = str(path_proj / 'roll_data') + os.sep
+    files.path_case_studies = str(path_proj / 'roll_case_studies') + os.sep
+    manifest = Manifest.FromFiles(files)
+    assert len(manifest.roots) == 3
+    assert manifest.pf_manifest == str(path_proj / 'manifest.json')
+
+def test_Update_manifest_inside_root(path_proj):
+    """
+    A manifest stored in an indexed root never lists itself
+    """
+    path_data = str(path_proj / 'roll_data')
+    manifest = Manifest([path_data], os.path.join(path_data, 'manifest.json'))
+    assert manifest.Update()['added'] == [os.path.join(path_data, 'lookup.csv')]
+    for _ in range(2):
+        changes = manifest.Update()
+        assert changes == {'added': [], 'changed': [], 'removed': []}
+    assert list(manifest.records) == ['lookup.csv']
@@ -0,0 +1,74 @@
+#Version 10/17/26
+#python -m pytest test_montecarlo.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from montecarlo import LengthMonteCarlo, Sample
+from roll2 import RollLength
+
+def MakeMC(**kwargs):
+    return LengthMonteCarlo(diam_roll=('normal', 120.5, 1.0), diam_core=43.2,
+                            caliper=('normal', 0.47, 0.01), **kwargs)
+
+def test_Run_matches_in_memory():
+    """
+    Chunked counts equal one in-memory evaluation of the same samples
+    """
+    mc = MakeMC(n_samples=25000, chunk_size=10000, seed=5).Run()
+    assert mc.counts.sum() + mc.n_invalid == 25000
+
+    lengths = []
+    for seed_seq, n in zip(np.random.SeedSequence(5).spawn(3),
+                           [10000, 10000, 5000]):
+        rng = np.random.default_rng(seed_seq)
+        diam_roll, caliper = rng.normal(120.5, 1., n), rng.normal(.47, .01, n)
+        lengths.append(RollLength.CalculateLengthArray(diam_roll, 43.2,
+                                                       caliper))
+    values, counts = np.unique(np.concatenate(lengths), return_counts=True)
+    assert np.allclose(mc.values, values)
+    assert np.array_equal(mc.counts, counts)
+
+def test_Percentiles_and_Summary():
+    """
+    Median near the deterministic length; spread from caliper and diameter
+    """
+    mc = MakeMC(n_samples=200000, chunk_size=50000).Run()
+    pct = mc.Percentiles((5, 50, 95))
+    assert pct[50] == pytest.approx(21.1, abs=0.1)
+    assert pct[5] < pct[50] < pct[95]
+
+    summary = mc.Summary()
+    assert summary['n'] == 200000
+    assert 0.4 < summary['std'] < 0.8
+
+    counts, edges = mc.Histogram(bins=20)
+    assert counts.sum() == 200000 and edges.size == 21
+
+def test_workers_reproducible():
+    """
+    Same seed gives identical results in-process and across processes
+    """
+    mc1 = MakeMC(n_samples=40000, chunk_size=10000).Run()
+    mc2 = MakeMC(n_samples=40000, chunk_size=10000, max_workers=2).Run()
+    assert np.array_equal(mc1.values, mc2.values)
+    assert np.array_equal(mc1.counts, mc2.counts)
+
+def test_fixed_inputs_and_errors():
+    mc = LengthMonteCarlo(120.5, 43.2, 0.47, n_samples=10, chunk_size=4).Run()
+    assert list(mc.values) == [21.1] and list(mc.counts) == [10]
+    with pytest.raises(ValueError):
+        LengthMonteCarlo(('gamma', 1.), 43.2, 0.47, n_samples=10).Run()
+
+def test_Sample_lognormal_in_mm():
+    """
+    Lognormal mean and sd are of the sampled values, not of their log
+    """
+    values = Sample(np.random.default_rng(0), ('lognormal', 120., 2.), 10**6)
+    assert values.mean() == pytest.approx(120., rel=1e-3)
+    assert values.std() == pytest.approx(2., rel=1e-2)
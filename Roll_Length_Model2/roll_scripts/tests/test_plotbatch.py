@@ -0,0 +1,60 @@
+#Version 10/17/26
+#python -m pytest test_plotbatch.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os, shutil
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+pytest.importorskip('matplotlib')
+from plotbatch import PlotRenderer
+
+@pytest.fixture()
+def path_home(tmp_path):
+    """
+    Case study home with a raw_data folder of two good and one bad file
+    """
+    path_rawdata = tmp_path / 'raw_data'
+    path_rawdata.mkdir()
+    shutil.copy(os.path.join(current_dir, 'df_raw_validation.xlsx'),
+                path_rawdata / 'roll_a.xlsx')
+    pd.DataFrame({'length': [10., 20., 30.], 'diameter': [80., 100., 120.]}
+                 ).to_csv(path_rawdata / 'roll_b.csv', index=False)
+    pd.DataFrame({'x': [1, 2]}).to_csv(path_rawdata / 'roll_bad.csv',
+                                       index=False)
+    return tmp_path
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_RenderAll(path_home, max_workers):
+    """
+    Renders every good file once; unchanged inputs are skipped on rerun
+    """
+    path_plots = str(path_home / 'plots')
+    renderer = PlotRenderer(str(path_home / 'raw_data'), path_plots,
+                            fmt='svg', max_workers=max_workers)
+    df = renderer.RenderAll()
+    assert list(df['status']) == ['rendered', 'rendered', 'error']
+    assert sorted(os.listdir(path_plots)) == \
+        ['plot_hashes.json', 'roll_a.xlsx_raw.svg', 
+         'roll_a.xlsx_transformed.svg', 'roll_b.csv_raw.svg', 
+         'roll_b.csv_transformed.svg']
+
+    pd.DataFrame({'length': [10., 30.], 'diameter': [80., 120.]}
+                 ).to_csv(path_home / 'raw_data' / 'roll_b.csv', index=False)
+    df = renderer.RenderAll()
+    assert list(df['status']) == ['skipped', 'rendered', 'error']
+
+def test_RenderAll_same_stem(path_home):
+    """
+    Raw files that differ only by extension get separate plots
+    """
+    pd.DataFrame({'length': [10., 20., 30.], 'diameter': [80., 100., 120.]}
+                 ).to_csv(path_home / 'raw_data' / 'roll_a.csv', index=False)
+    path_plots = str(path_home / 'plots')
+    PlotRenderer(str(path_home / 'raw_data'), path_plots, fmt='svg',
+                 max_workers=1).RenderAll()
+    files = os.listdir(path_plots)
+    assert 'roll_a.csv_raw.svg' in files and 'roll_a.xlsx_raw.svg' in files
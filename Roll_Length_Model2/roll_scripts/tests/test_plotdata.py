@@ -0,0 +1,77 @@
+#Version 10/17/26
+#python -m pytest test_plotdata.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import pandas as pd
+import numpy as np
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from plotdata import PlotData
+from roll2 import RollLength
+
+def test_PlotStrategy():
+    assert PlotData.PlotStrategy(1000) == 'scatter'
+    assert PlotData.PlotStrategy(10**6) == 'decimate'
+    assert PlotData.PlotStrategy(10**7) == 'density'
+    assert PlotData.PlotStrategy(10, mode='density') == 'density'
+    with pytest.raises(ValueError):
+        PlotData.PlotStrategy(10, mode='densty')
+
+def test_DecimateMinMax():
+    """
+    Output is bounded and keeps spikes (glitched readings) visible
+    """
+    n = 100003
+    X = np.arange(n, dtype=float)
+    Y = np.sin(X / 1000)
+    Y[54321], Y[n - 1] = 50., -50.
+    Xd, Yd = PlotData.DecimateMinMax(X, Y, n_buckets=100)
+    assert Xd.size <= 2 * 100 + 2
+    assert Yd.max() == 50. and Yd.min() == -50.
+    assert np.all(np.diff(Xd) > 0)
+
+def test_DecimateMinMax_dropout():
+    """
+    A NaN dropout filling whole buckets is skipped, not an error
+    """
+    n = 200000
+    X = np.arange(n, dtype=float)
+    Y = np.sin(X / 1000)
+    Y[1000:1200] = np.nan
+    Xd, Yd = PlotData.DecimateMinMax(X, Y)
+    assert np.isfinite(Yd).all() and Xd.size <= 2 * 5000 + 2
+    assert not np.any((Xd >= 1000) & (Xd < 1200))
+
+def test_Density2D():
+    X = np.array([0., 1., np.nan, 1.])
+    Y = np.array([0., 1., 1., 1.])
+    counts, x_edges, y_edges = PlotData.Density2D(X, Y, bins=2)
+    assert counts.sum() == 3
+    assert counts[1, 1] == 2
+
+@pytest.mark.parametrize('mode', ['scatter', 'decimate', 'density'])
+def test_XYDataPlot_modes(mode):
+    """
+    Each strategy draws on a headless Axes with the fitted line overlaid
+    """
+    matplotlib = pytest.importorskip('matplotlib')
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    roll = RollLength()
+    diameter = np.linspace(150., 45., 20000)
+    roll.AppendRawData(RollLength.CalculateLengthArray(diameter, 40., 0.5),
+                       diameter)
+    roll.df_raw = pd.DataFrame({'diameter': diameter})
+
+    fig, ax = plt.subplots()
+    RollLength.XYDataPlot(diameter, diameter * 2, 'x', 'y', 'title',
+                          mode=mode, fit_xy=roll.FitLinePoints('diameter'),
+                          ax=ax)
+    assert ax.get_title() == 'title'
+    assert len(ax.lines) == 1
+    plt.close(fig)
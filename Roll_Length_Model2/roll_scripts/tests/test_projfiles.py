@@ -0,0 +1,69 @@
+#Version 10/17/26
+#python -m pytest test_projfiles.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+import projfiles
+from projfiles import Files, FileIndex
+
+def test_Files_layout_cache(monkeypatch):
+    """
+    Second instance with the same arguments reuses the resolved layout
+    """
+    Files.dict_layouts.clear()
+    files1 = Files('roll', subdir_home='_dev')
+    monkeypatch.setattr(Files, 'BuildLstPaths',
+                        lambda self, i: pytest.fail('layout not cached'))
+    files2 = Files('roll', subdir_home='_dev')
+    assert files2.path_rawdata == files1.path_rawdata
+    assert files2.path_rawdata.endswith(os.sep.join(['roll_case_studies',
+                                                     '_dev', 'raw_data', '']))
+    files2.lstpaths.append('x')
+    assert 'x' not in files1.lstpaths
+
+@pytest.fixture()
+def path_tree(tmp_path):
+    """
+    case_studies/<case>/raw_data files plus a data folder
+    """
+    for case in ['case_a', 'case_b']:
+        path_raw = tmp_path / 'case_studies' / case / 'raw_data'
+        path_raw.mkdir(parents=True)
+        (path_raw / f'{case}.xlsx').write_text('x')
+        (path_raw / f'{case}.csv').write_text('x')
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'data' / 'lookup.XLSX').write_text('x')
+    return tmp_path
+
+def test_FileIndex_queries(path_tree, monkeypatch):
+    """
+    Nested roots are scanned once; queries don't touch the disk
+    """
+    path_cases = str(path_tree / 'case_studies')
+    roots = [path_cases, str(path_tree / 'case_studies' / 'case_a'),
+             str(path_tree / 'data')]
+    index = FileIndex(roots)
+    assert len(index.entries) == 5
+
+    monkeypatch.setattr(projfiles.os, 'scandir',
+                        lambda p: pytest.fail('disk walk during query'))
+    assert len(index.ByExtension('.xlsx')) == 3
+    assert len(index.ByExtension(('.csv', '.xlsx'), root=path_cases)) == 4
+    assert [os.path.basename(p) for p in
+            index.Glob('*/raw_data/*.csv', root=path_cases)] == \
+        ['case_a.csv', 'case_b.csv']
+    assert [os.path.basename(p) for p in index.Glob('case_b.*')] == \
+        ['case_b.csv', 'case_b.xlsx']
+
+def test_GetFileIndex_cached():
+    files = Files('roll', subdir_home='_dev')
+    index = files.GetFileIndex()
+    assert files.GetFileIndex() is index
+    assert files.GetFileIndex(refresh=True) is not index
+    assert any(p.endswith('cushiony_tp_length_vs_diam.xlsx')
+               for p in index.Glob('*.xlsx', root=files.path_rawdata))
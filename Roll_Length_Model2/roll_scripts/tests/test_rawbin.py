@@ -0,0 +1,84 @@
+#Version 10/17/26
+#python -m pytest test_rawbin.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import pandas as pd
+import numpy as np
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from rawbin import RawBinary, RawBinaryWriter
+from roll2 import RollLength
+
+@pytest.fixture()
+def pf_rlb(tmp_path):
+    return str(tmp_path / 'log.rlb')
+
+def test_append_and_Open(pf_rlb):
+    """
+    Appends from separate writer sessions read back as one memmap
+    """
+    with RawBinaryWriter(pf_rlb) as writer:
+        writer.Append([1., 2.], [100., 110.])
+    with RawBinaryWriter(pf_rlb) as writer:
+        writer.Append(length=3., diameter=120.)
+
+    rec = RawBinary.Open(pf_rlb)
+    assert isinstance(rec, np.memmap)
+    assert list(rec['length']) == [1., 2., 3.]
+    assert list(rec['diameter']) == [100., 110., 120.]
+
+def test_partial_record_ignored(pf_rlb):
+    """
+    A partially written trailing record is invisible to readers and is
+    dropped by the next writer
+    """
+    with RawBinaryWriter(pf_rlb, dtype=np.float32) as writer:
+        writer.Append([1., 2.], [100., 110.])
+    with open(pf_rlb, 'ab') as f: f.write(b'\x00\x01\x02')
+    assert len(RawBinary.Open(pf_rlb)) == 2
+
+    with RawBinaryWriter(pf_rlb) as writer: writer.Append(3., 120.)
+    rec = RawBinary.Open(pf_rlb)
+    assert rec.dtype['length'] == np.float32
+    assert list(rec['diameter']) == [100., 110., 120.]
+
+def test_Open_errors(tmp_path):
+    pf = str(tmp_path / 'bad.rlb')
+    with open(pf, 'wb') as f: f.write(b'not a raw file')
+    with pytest.raises(ValueError):
+        RawBinary.Open(pf)
+
+def test_RollLength_rlb(pf_rlb):
+    """
+    RollLength fits a .rlb file from the memmap without building df_raw
+    """
+    df = pd.read_excel(os.path.join(current_dir, 'df_raw_validation.xlsx'))
+    RawBinary.FromDataFrame(df, pf_rlb)
+
+    roll = RollLength(file_raw=pf_rlb)
+    assert roll.CaliperFromRawData == pytest.approx(0.5027, abs=1e-4)
+    assert roll.df_raw is None
+    assert np.shares_memory(roll.RawColumn('length'), roll.raw_mmap)
+
+def test_RollLength_rlb_fit_peak(pf_rlb):
+    """
+    Fitting a memory-mapped log holds fixed-size blocks, not column copies
+    """
+    import tracemalloc
+    from fitstats import BLOCK_ROWS
+    n = 10**6
+    diameter = np.linspace(150., 45., n)
+    length = RollLength.CalculateLengthArray(diameter, 40., 0.5)
+    with RawBinaryWriter(pf_rlb) as writer: writer.Append(length, diameter)
+
+    roll = RollLength(file_raw=pf_rlb)
+    roll.ReadRawData()
+    tracemalloc.start()
+    roll.FitRawData()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 4 * 8 * BLOCK_ROWS < 8 * n
@@ -0,0 +1,88 @@
+#Version 10/17/26
+#python -m pytest test_rawcache.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os, shutil
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from rawcache import RawDataCache
+from roll2 import RollLength
+
+@pytest.fixture()
+def file_raw(tmp_path):
+    """
+    Copy of the validation workbook that tests can modify
+    """
+    pf = tmp_path / 'df_raw_validation.xlsx'
+    shutil.copy(os.path.join(current_dir, 'df_raw_validation.xlsx'), pf)
+    return str(pf)
+
+@pytest.fixture()
+def cache(tmp_path):
+    return RawDataCache(str(tmp_path / 'cache'))
+
+def test_Read_hit_and_miss(file_raw, cache):
+    """
+    First read parses the workbook; second is served from the cache
+    """
+    df1 = cache.Read(file_raw)
+    df2 = cache.Read(file_raw)
+    assert (cache.misses, cache.hits) == (1, 1)
+    pd.testing.assert_frame_equal(df1, df2, check_dtype=False)
+
+def test_Read_text_columns_not_cached(tmp_path, cache):
+    """
+    Text or mixed columns are parsed every read so missing cells and mixed
+    types come back exactly as the parser returns them
+    """
+    pf = str(tmp_path / 'notes.xlsx')
+    pd.DataFrame({'length': [0., 20., 30.], 'diameter': [40, 120, 150],
+                  'note': ['ok', None, 'x'], 'mixed': [1, 'x', 2.5]}
+                 ).to_excel(pf, index=False)
+    df1 = cache.Read(pf)
+    df2 = cache.Read(pf)
+    assert (cache.misses, cache.hits) == (2, 0)
+    assert cache.ListEntries() == []
+    pd.testing.assert_frame_equal(df1, df2)
+    assert df2['mixed'].tolist() == [1, 'x', 2.5]
+
+def test_Read_changed_source(file_raw, cache):
+    """
+    A changed source file is re-parsed; a touched but identical one is not
+    """
+    cache.Read(file_raw)
+    os.utime(file_raw, ns=(0, 0))
+    cache.Read(file_raw)
+    assert cache.misses == 1
+
+    pd.DataFrame({'length': [1., 2., 3.], 'diameter': [50., 60., 70.]}
+                 ).to_excel(file_raw, index=False)
+    df = cache.Read(file_raw)
+    assert cache.misses == 2
+    assert df.index.size == 3
+
+def test_Invalidate_and_Evict(file_raw, cache):
+    """
+    Explicit invalidation forces a re-parse; max_bytes bounds the cache
+    """
+    cache.Read(file_raw)
+    cache.Invalidate(file_raw)
+    cache.Read(file_raw)
+    assert cache.misses == 2
+
+    cache.max_bytes = 0
+    cache.Evict()
+    assert cache.ListEntries() == []
+
+def test_RollLength_raw_cache(file_raw, cache):
+    """
+    RollLength reads through the cache and fits the same caliper
+    """
+    for _ in range(2):
+        roll = RollLength(file_raw=file_raw, raw_cache=cache)
+        assert roll.CaliperFromRawData == pytest.approx(0.5027, abs=1e-4)
+    assert (cache.misses, cache.hits) == (1, 1)
@@ -0,0 +1,87 @@
+#Version 10/17/26
+#python -m pytest test_rawcheck.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from rawcheck import CHECKS, RawDataValidator
+
+@pytest.fixture()
+def df_bad():
+    """
+    Unwinder log (length rises with diameter) with one row per defect:
+    NaN length (2), non-positive diameter (4), reversal (6), duplicate (8)
+    """
+    diameter = np.linspace(40., 120., 10)
+    length = np.round((diameter / 1000) ** 2 * 1500, 1)
+    df = pd.DataFrame({'length': length, 'diameter': diameter})
+    df.loc[2, 'length'] = np.nan
+    df.loc[4, 'diameter'] = -1.
+    df.loc[6, 'length'] = 0.
+    df.loc[8] = df.loc[7]
+    return df
+
+def test_Check_report(df_bad):
+    validator = RawDataValidator()
+    report = validator.Check(df_bad['length'].values, df_bad['diameter'].values)
+    assert report == {'n_rows': 10, 'n_nan': 1, 'n_non_positive': 1,
+                      'n_non_monotonic': 4, 'n_duplicate': 1, 'n_valid': 7,
+                      'IsValid': False}
+    assert list(np.flatnonzero(validator.masks['nan'])) == [2]
+    assert list(np.flatnonzero(validator.masks['non_positive'])) == [4]
+
+    #Both rows of each reversal: the negative diameter and the zero length
+    #against their previous rows
+    assert list(np.flatnonzero(validator.masks['non_monotonic'])) == \
+        [3, 4, 5, 6]
+    assert list(np.flatnonzero(validator.masks['duplicate'])) == [8]
+
+    #Reverse log order is still monotonic
+    report = validator.Check(df_bad['length'].values[::-1].copy(), 
+                             df_bad['diameter'].values[::-1].copy())
+    assert report['n_non_monotonic'] == 4
+
+def test_Check_tolerance():
+    """
+    Reversals within the noise tolerances are not flagged
+    """
+    length = np.array([10., 20., 19.8, 30.])
+    diameter = np.array([50., 60., 60.5, 70.])
+    assert RawDataValidator().Check(length, diameter)['n_non_monotonic'] == 2
+    validator = RawDataValidator(tol_length=0.5)
+    assert validator.Check(length, diameter)['IsValid']
+
+def test_Check_spike():
+    """
+    A one-row diameter spike is flagged (with the neighbor it reverses
+    against), so dropping non_monotonic removes the glitch
+    """
+    length = np.array([1., 2., 3., 4., 5.])
+    diameter = np.array([10., 20., 100., 40., 50.])
+    validator = RawDataValidator(drop=CHECKS)
+    validator.Check(length, diameter)
+    assert list(np.flatnonzero(validator.masks['non_monotonic'])) == [2, 3]
+    assert list(validator.Clean(diameter)) == [10., 20., 50.]
+
+def test_Clean(df_bad):
+    """
+    Drop checks select rows; clean data is returned without a copy
+    """
+    validator = RawDataValidator()
+    validator.Check(df_bad['length'].values, df_bad['diameter'].values)
+    df_clean = validator.Clean(df_bad)
+    assert list(df_clean.index) == [0, 1, 3, 5, 6, 7, 9]
+
+    validator = RawDataValidator(drop=CHECKS)
+    validator.Check(df_bad['length'].values, df_bad['diameter'].values)
+    assert list(validator.Clean(df_bad).index) == [0, 1, 7, 9]
+
+    df_ok = df_bad.loc[[0, 1, 3, 5]]
+    validator.Check(df_ok['length'].values, df_ok['diameter'].values)
+    assert validator.Clean(df_ok) is df_ok
@@ -0,0 +1,65 @@
+#Version 10/17/26
+#python -m pytest test_resultstore.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os, shutil
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from resultstore import ResultStore
+
+@pytest.fixture()
+def store(tmp_path):
+    with ResultStore(str(tmp_path / 'results.db')) as store:
+        yield store
+
+def test_InsertFits_and_query(store):
+    """
+    Bulk insert, hash lookup and caliper/case study queries
+    """
+    fits = [{'file_hash': f'h{i}', 'file_raw': f'roll_{i}.xlsx',
+             'case_study': 'A' if i < 500 else 'B', 'n_rows': 10,
+             'slope': 1000., 'intercept': 0., 'R_squared': 1.,
+             'caliper': 0.3 + i / 10000} for i in range(1000)]
+    fits.append({'file_hash': 'bad', 'error': 'KeyError'})
+    assert store.InsertFits(fits) == 1000
+
+    found = store.LookupFits([f'h{i}' for i in range(0, 1000, 2)] + ['x'])
+    assert len(found) == 500
+    assert store.LookupFit('h3')['caliper'] == pytest.approx(0.3003)
+    assert store.LookupFit('h3', fit_method='robust') is None
+
+    df = store.QueryFits(case_study='B', caliper_max=0.36)
+    assert len(df) == 101
+    assert df['caliper'].max() <= 0.36
+
+    plan = store.conn.execute('EXPLAIN QUERY PLAN SELECT * FROM fits '
+                              'WHERE caliper > 0.35').fetchall()
+    assert 'idx_fits_caliper' in str([tuple(r) for r in plan])
+
+def test_InsertLengths(store):
+    df = pd.DataFrame({'diam_roll': [120.5, 100.], 'diam_core': 43.2,
+                       'caliper': [0.47, 0.5], 'length': [21.1, 12.8]})
+    assert store.InsertLengths(df, case_study='A') == 2
+    assert list(store.QueryLengths(caliper_min=0.48)['length']) == [12.8]
+
+def test_FitFiles_skips_stored(store, tmp_path):
+    """
+    Rerun only fits files whose content hash is not yet stored
+    """
+    pf_a = str(tmp_path / 'roll_a.xlsx')
+    shutil.copy(os.path.join(current_dir, 'df_raw_validation.xlsx'), pf_a)
+    pf_b = str(tmp_path / 'roll_b.csv')
+    pd.DataFrame({'length': [10., 20.], 'diameter': [80., 120.]}
+                 ).to_csv(pf_b, index=False)
+
+    df = store.FitFiles([pf_a], case_study='A')
+    assert list(df['IsCached']) == [False]
+    assert df.loc[0, 'caliper'] == pytest.approx(0.5027, abs=1e-4)
+
+    df = store.FitFiles([pf_a, pf_b], case_study='A')
+    assert list(df['IsCached']) == [True, False]
+    assert len(store.QueryFits(case_study='A')) == 2
@@ -2,7 +2,7 @@
 #python -m pytest test_roll.py -v -s
 #2345678901234567890123456789012345678901234567890123456789012345678901234567890
 
-import sys, os
+import sys, os, subprocess
 import pandas as pd
 import numpy as np
 import pytest
@@ -11,6 +11,7 @@ scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
 scripts_dir = scripts_dir + os.sep + 'roll_scripts'
 if not scripts_dir in sys.path: sys.path.append(scripts_dir)
 from roll2 import RollLength
+import rawbin
 
 IsPrint = False
 
@@ -97,6 +98,193 @@ def test_CalculateCaliper(roll_raw_fit):
     assert roll_raw_fit.caliper == pytest.approx(0.5027, abs=1e-4)
 
 
+"""
+=========================================================================
+CaliperFromRawData Streaming
+=========================================================================
+"""
+@pytest.fixture()
+def df_log():
+    """
+    Noisy unwinder log: length [m] vs. diameter [mm] for a 0.5 mm caliper
+    """
+    rng = np.random.default_rng(3)
+    diameter = np.linspace(150., 45., 5000)
+    length = RollLength.CalculateLengthArray(diameter, 40., 0.5)
+    length = length + rng.normal(0., 0.2, diameter.size)
+    return pd.DataFrame({'length': length, 'diameter': diameter})
+
+def test_CaliperFromRawDataStreaming(df_log, tmp_path):
+    """
+    Chunked CSV fit matches the in-memory procedure
+    """
+    pf = str(tmp_path / 'log.csv')
+    df_log.to_csv(pf, index=False)
+
+    roll_stream = RollLength(file_raw=pf)
+    roll_stream.CaliperFromRawDataStreaming(chunksize=700)
+    assert roll_stream.df_raw is None
+
+    roll = RollLength()
+    roll.df_raw = df_log.copy()
+    roll.AddCalculatedRawCols()
+    roll.FitRawData()
+    roll.CalculateCaliper()
+    assert np.isclose(roll_stream.slope, roll.slope)
+    assert np.isclose(roll_stream.R_squared, roll.R_squared)
+    assert roll_stream.caliper == roll.caliper
+
+def test_CaliperFromRawDataProcedure_robust(df_log, tmp_path):
+    """
+    Robust option rejects a glitched diameter reading and keeps caliper
+    """
+    df_log.loc[100, 'diameter'] = 5.
+    pf = str(tmp_path / 'log.csv')
+    df_log.to_csv(pf, index=False)
+
+    roll = RollLength(file_raw=pf)
+    roll.CaliperFromRawDataProcedure(robust=True)
+    assert roll.caliper == pytest.approx(0.5, abs=1e-3)
+    assert list(np.flatnonzero(roll.outliers)) == [100]
+
+    roll.CaliperFromRawDataProcedure()
+    assert roll.outliers is None
+
+def test_CaliperFromRawDataProcedure_validate(df_log, tmp_path):
+    """
+    Validation gate drops NaN, non-positive and duplicate rows before the
+    fit (csv and memory-mapped .rlb); unvalidated NaN rows raise
+    """
+    df_log.loc[10, 'length'] = np.nan
+    df_log.loc[20, 'diameter'] = 0.
+    df_log.loc[31] = df_log.loc[30]
+    pf = str(tmp_path / 'log.csv')
+    df_log.to_csv(pf, index=False)
+    pf_rlb = str(tmp_path / 'log.rlb')
+    rawbin.RawBinary.FromDataFrame(df_log, pf_rlb)
+
+    roll = RollLength(file_raw=pf)
+    with pytest.raises(ValueError):
+        roll.CaliperFromRawDataProcedure()
+
+    for file_raw in (pf, pf_rlb):
+        roll = RollLength(file_raw=file_raw)
+        roll.CaliperFromRawDataProcedure(validate=True)
+        assert roll.caliper == pytest.approx(0.5, abs=1e-3)
+        assert roll.raw_quality['n_valid'] == 4997
+        assert len(roll.RawColumn('length')) == 4997
+
+def test_ValidateRawData_too_few_rows(tmp_path):
+    pf = str(tmp_path / 'log.csv')
+    pd.DataFrame({'length': [np.nan, 5.], 'diameter': [80., -1.]}
+                 ).to_csv(pf, index=False)
+    roll = RollLength(file_raw=pf)
+    roll.ReadRawData()
+    assert not roll.ValidateRawData()['IsValid']
+    with pytest.raises(ValueError):
+        roll.ValidateRawData(IsClean=True)
+
+def test_BootstrapFitRawData(df_log):
+    """
+    Caliper interval brackets the fitted caliper and the true 0.5 mm
+    """
+    roll = RollLength()
+    roll.df_raw = df_log
+    roll.AddCalculatedRawCols()
+    roll.FitRawData()
+    roll.CalculateCaliper()
+    ci = roll.BootstrapFitRawData(n_boot=500, seed=1)
+    assert ci is roll.fit_ci
+    assert ci['caliper'][0] <= roll.caliper <= ci['caliper'][1]
+    assert ci['caliper'][0] <= 0.5 <= ci['caliper'][1]
+    assert ci['caliper'][1] - ci['caliper'][0] < 0.01
+
+@pytest.mark.parametrize('raw_dtype', [np.float64, np.float32])
+def test_CaliperFromRawDataProcedure_low_memory(df_log, tmp_path, raw_dtype):
+    """
+    Projected, optionally float32 raw table with diam_m^2 on demand fits 
+    the same caliper to within its 0.0001 mm rounding
+    """
+    df_log['comment'] = 'x'
+    pf = str(tmp_path / 'log.csv')
+    df_log.to_csv(pf, index=False)
+
+    roll = RollLength(file_raw=pf)
+    roll.CaliperFromRawDataProcedure()
+    roll_lm = RollLength(file_raw=pf, IsLowMemory=True, raw_dtype=raw_dtype)
+    roll_lm.CaliperFromRawDataProcedure()
+
+    assert list(roll_lm.df_raw.columns) == ['length', 'diameter']
+    assert (roll_lm.df_raw.dtypes == raw_dtype).all()
+    assert roll_lm.caliper == pytest.approx(roll.caliper, abs=1e-4)
+    assert np.allclose(roll_lm.RawColumn('diam_m^2'), 
+                       roll.df_raw['diam_m^2'], rtol=1e-6)
+
+@pytest.mark.parametrize('raw_dtype', [np.float64, np.float32])
+def test_FitRawData_low_memory_peak(raw_dtype):
+    """
+    Fit-phase peak memory is fixed-size blocks, not copies of the columns
+    (well under one float32 column of 10**6 rows)
+    """
+    import tracemalloc
+    from fitstats import BLOCK_ROWS
+    n = 10**6
+    diameter = np.linspace(150., 45., n)
+    roll = RollLength(IsLowMemory=True)
+    roll.df_raw = pd.DataFrame({
+        'length': RollLength.CalculateLengthArray(diameter, 40., 0.5),
+        'diameter': diameter}).astype(raw_dtype)
+
+    tracemalloc.start()
+    roll.FitRawData()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 4 * 8 * BLOCK_ROWS < 4 * n
+    roll.CalculateCaliper()
+    assert roll.caliper == pytest.approx(0.5, abs=1e-4)
+
+def test_AppendRawData(df_log):
+    """
+    Appending rows updates the fit as if all rows were fit together
+    """
+    roll = RollLength()
+    roll.AppendRawData(df_log['length'][:2000], df_log['diameter'][:2000])
+    caliper = roll.AppendRawData(df_log['length'][2000:], 
+                                 df_log['diameter'][2000:])
+    assert roll.fit_stats.n == len(df_log)
+    assert caliper == pytest.approx(0.5, abs=1e-3)
+
+    #A non-finite sample raises and leaves the running fit intact
+    with pytest.raises(ValueError):
+        roll.AppendRawData([np.nan, 10.], [100., 80.])
+    assert roll.fit_stats.n == len(df_log)
+    assert roll.AppendRawData(df_log['length'][:5], 
+                              df_log['diameter'][:5]) == caliper
+
+def test_AppendRawData_after_procedure(df_log, tmp_path):
+    """
+    Appending extends the procedure's fit instead of starting over; a
+    robust fit cannot be extended
+    """
+    pf = str(tmp_path / 'log.csv')
+    df_log[:1000].to_csv(pf, index=False)
+    roll = RollLength(file_raw=pf)
+    roll.CaliperFromRawDataProcedure()
+    roll.AppendRawData(df_log['length'][1000:], df_log['diameter'][1000:])
+    assert roll.fit_stats.n == len(df_log)
+
+    roll_all = RollLength()
+    roll_all.df_raw = df_log.copy()
+    roll_all.AddCalculatedRawCols()
+    roll_all.FitRawData()
+    roll_all.CalculateCaliper()
+    assert np.isclose(roll.slope, roll_all.slope)
+    assert roll.caliper == roll_all.caliper
+
+    roll.CaliperFromRawDataProcedure(robust=True)
+    with pytest.raises(ValueError):
+        roll.AppendRawData(df_log['length'][:2], df_log['diameter'][:2])
+
 """
 =========================================================================
 Instancing RollLength Class
@@ -161,6 +349,20 @@ def test_CalculateLength(roll_LCalc):
     roll_LCalc.CalculateLengthProcedure()
     assert roll_LCalc.length == 21.1
 
+@pytest.mark.parametrize('inputs', [(None, 43.2, 0.47), (120.5, 43.2, 0.),
+                                    (120.5, 43.2, None)])
+def test_CalculateLength_invalid(inputs):
+    """
+    Missing inputs or a non-positive caliper raise and are not cached
+    """
+    roll = RollLength(diam_roll=inputs[0], diam_core=inputs[1], 
+                      caliper=inputs[2])
+    with pytest.raises(ValueError):
+        roll.CalculateLengthProcedure()
+    with pytest.raises(ValueError):
+        roll.CalculateLength
+    assert roll.key_length is None
+
 def test_LCalc_fixture(roll_LCalc):
     """
     Check fixture's inputs
@@ -170,6 +372,144 @@ def test_LCalc_fixture(roll_LCalc):
     assert roll_LCalc.diam_core == 43.2
     assert roll_LCalc.caliper == 0.47
 
+"""
+=========================================================================
+Memoized properties
+=========================================================================
+"""
+def test_CaliperFromRawData_memo(roll_raw_fit, monkeypatch):
+    """
+    Repeated reads reuse the fit; changing file_raw or caliper reruns it
+    """
+    calls = []
+    read = roll_raw_fit.ReadRawData
+    monkeypatch.setattr(roll_raw_fit, 'ReadRawData', 
+                        lambda: calls.append(1) or read())
+    for _ in range(3): caliper = roll_raw_fit.CaliperFromRawData
+    assert caliper == pytest.approx(0.5027, abs=1e-4)
+    assert len(calls) == 1
+
+    roll_raw_fit.caliper = 0.1
+    assert roll_raw_fit.CaliperFromRawData == caliper
+    roll_raw_fit.Invalidate()
+    roll_raw_fit.CaliperFromRawData
+    assert len(calls) == 3
+
+def test_CalculateLength_memo(roll_LCalc):
+    """
+    Length memo follows input changes; LRU counts hits across instances
+    """
+    RollLength.ClearLengthCache()
+    assert roll_LCalc.CalculateLength == 21.1
+    assert roll_LCalc.CalculateLength == 21.1
+    assert RollLength.LengthCacheInfo().misses == 1
+    assert RollLength.LengthCacheInfo().hits == 0
+
+    roll_LCalc.caliper = 0.235
+    assert roll_LCalc.CalculateLength == 42.3
+
+    RollLength(diam_roll=120.5, diam_core=43.2, caliper=0.47).CalculateLength
+    info = RollLength.LengthCacheInfo()
+    assert (info.hits, info.misses) == (1, 2)
+
+"""
+=========================================================================
+Batch length calculation - vectorized over arrays of rolls
+=========================================================================
+"""
+@pytest.fixture()
+def df_rolls():
+    """
+    Random roll inputs [mm] with one row per roll
+    """
+    rng = np.random.default_rng(42)
+    n = 500
+    return pd.DataFrame({'diam_roll': rng.uniform(80., 200., n),
+                         'diam_core': rng.uniform(30., 50., n),
+                         'caliper': rng.uniform(0.1, 1.0, n)})
+
+def test_CalculateLengthArray(df_rolls):
+    """
+    Vectorized lengths identical to one RollLength instance per roll
+    """
+    lengths = RollLength.CalculateLengthArray(df_rolls['diam_roll'].values, 
+                                              df_rolls['diam_core'].values, 
+                                              df_rolls['caliper'].values)
+    expected = [RollLength(diam_roll=r, diam_core=c, caliper=t).CalculateLength 
+                for r, c, t in df_rolls.itertuples(index=False)]
+    assert lengths.shape == (len(df_rolls),)
+    assert np.array_equal(lengths, np.array(expected))
+
+def test_CalculateLengthArray_broadcast():
+    """
+    Scalar core and caliper broadcast against an array of roll diameters
+    """
+    lengths = RollLength.CalculateLengthArray([120.5, 120.5], 43.2, 0.47)
+    assert list(lengths) == [21.1, 21.1]
+
+def test_CalculateLengthBatch(df_rolls):
+    """
+    DataFrame input returns a Series aligned to the roll table
+    """
+    df_rolls.index = df_rolls.index + 100
+    lengths = RollLength.CalculateLengthBatch(df_rolls)
+    assert lengths.name == 'length'
+    assert lengths.index.equals(df_rolls.index)
+    roll = RollLength(diam_roll=df_rolls.loc[100, 'diam_roll'], 
+                      diam_core=df_rolls.loc[100, 'diam_core'], 
+                      caliper=df_rolls.loc[100, 'caliper'])
+    assert lengths.loc[100] == roll.CalculateLength
+
+
+def test_CalculateDiameterArray(df_rolls):
+    """
+    Diameter for a target length round-trips through the forward formula
+    """
+    target = np.linspace(5., 100., len(df_rolls))
+    diam_roll = RollLength.CalculateDiameterArray(target, 
+                                                  df_rolls['diam_core'].values, 
+                                                  df_rolls['caliper'].values)
+    lengths = RollLength.CalculateLengthArray(diam_roll, 
+                                              df_rolls['diam_core'].values, 
+                                              df_rolls['caliper'].values)
+    assert np.allclose(lengths, target, atol=0.05)
+    assert RollLength.CalculateDiameterArray(21.1, 43.2, 0.47) == \
+        pytest.approx(120.5, abs=0.2)
+
+def test_CalculateCaliperArray():
+    """
+    Implied caliper from length and diameters; invalid lengths give NaN
+    """
+    calipers = RollLength.CalculateCaliperArray([21.1, 0.], 120.5, 43.2)
+    assert calipers[0] == pytest.approx(0.47, abs=2e-3)
+    assert np.isnan(calipers[1])
+
+"""
+=========================================================================
+Import time - core length math must not pull in heavy libraries
+=========================================================================
+"""
+#Generous budget [s] for a cold "import roll2" (numpy dominates)
+IMPORT_BUDGET = 2.0
+
+def test_ImportTime():
+    """
+    Import roll2 in a fresh interpreter with -X importtime and check that
+    pandas, matplotlib and sklearn stay unloaded until first use
+    """
+    code = ('import sys, roll2; '
+            'print([m for m in ("pandas", "matplotlib", "sklearn") '
+            'if m in sys.modules])')
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], 
+                            cwd=scripts_dir, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '[]'
+
+    #importtime lines are "import time: self [us] | cumulative | module"
+    line = [l for l in result.stderr.splitlines() if l.endswith('| roll2')][0]
+    cumulative_s = int(line.split('|')[1]) / 1e6
+    if IsPrint: PrintVars(cumulative_s, 'roll2 import time [s]')
+    assert cumulative_s < IMPORT_BUDGET
 
 """
 =========================================================================
@@ -0,0 +1,79 @@
+#Version 10/17/26
+#python -m pytest test_rollbatch.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from rollbatch import RollBatch
+from roll2 import RollLength
+
+@pytest.fixture()
+def batch():
+    """
+    Four rolls sharing a 43.2 mm core
+    """
+    return RollBatch(diam_roll=[120.5, 100., 150., 80.], diam_core=43.2,
+                     caliper=[0.47, 0.5, 0.47, 0.3])
+
+def test_CalculateLength(batch):
+    """
+    Column lengths match RollLength one roll at a time
+    """
+    lengths = batch.CalculateLength
+    for i in range(len(batch)):
+        assert lengths[i] == batch[i].CalculateLength
+    assert lengths[0] == 21.1
+
+def test_CalculateCaliper():
+    """
+    Caliper from slope matches RollLength.CalculateCaliper
+    """
+    batch = RollBatch(slope=[1562.5, 1000.])
+    roll = RollLength()
+    roll.slope = 1562.5
+    roll.CalculateCaliper()
+    assert batch.CalculateCaliper[0] == roll.caliper
+    with pytest.raises(ValueError):
+        RollBatch(diam_roll=[1.]).CalculateCaliperProcedure()
+
+def test_slicing_and_Filter(batch):
+    """
+    Slices are views; Filter keeps rolls matching a mask
+    """
+    sub = batch[1:3]
+    assert len(sub) == 2
+    assert np.shares_memory(sub.diam_roll, batch.diam_roll)
+
+    batch.CalculateLengthProcedure()
+    long_rolls = batch.Filter(batch.length > 20)
+    assert list(long_rolls.diam_roll) == [120.5, 150.]
+    assert long_rolls.slope is None
+
+def test_memory_and_conversions(batch):
+    """
+    float32 columns cost 4 bytes per roll per column; round-trips work
+    """
+    n = 100000
+    small = RollBatch(diam_roll=np.full(n, 120.), diam_core=43.,
+                      caliper=0.5, dtype=np.float32)
+    assert small.nbytes == 3 * 4 * n
+
+    #Length stays float64 so its 0.1 m rounding is exact
+    long = RollBatch(diam_roll=2000., diam_core=43.2, caliper=0.3,
+                     dtype=np.float32)
+    assert long.CalculateLength.dtype == np.float64
+    assert long.length[0] == 10467.1
+    assert long[0:1].length.dtype == np.float64
+    assert not hasattr(small, '__dict__')
+
+    df = batch.ToDataFrame()
+    assert list(df.columns) == ['diam_roll', 'diam_core', 'caliper']
+    assert len(RollBatch.FromDataFrame(df)) == 4
+
+    rolls = [RollLength(diam_roll=120.5, diam_core=43.2, caliper=0.47)]
+    assert RollBatch.FromRolls(rolls).CalculateLength[0] == 21.1
@@ -0,0 +1,58 @@
+#Version 10/17/26
+#python -m pytest test_sweep.py -v -s
+#2345678901234567890123456789012345678901234567890123456789012345678901234567890
+
+import sys, os
+import numpy as np
+import pandas as pd
+import pytest
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.sep.join(os.path.dirname(current_dir).split(os.sep)[:-1])
+scripts_dir = scripts_dir + os.sep + 'roll_scripts'
+if not scripts_dir in sys.path: sys.path.append(scripts_dir)
+from sweep import ParameterSweep
+from roll2 import RollLength
+
+@pytest.fixture()
+def sweep_axes():
+    return dict(diam_roll=np.linspace(60., 200., 57), diam_core=[38.1, 76.2],
+                caliper=np.linspace(0.3, 0.7, 11))
+
+def test_Run_csv_matches_loop(sweep_axes, tmp_path):
+    """
+    Tiled CSV output equals looping RollLength over the grid (grid order,
+    invalid rows dropped)
+    """
+    pf = str(tmp_path / 'sweep.csv')
+    stats = ParameterSweep(tile_size=100, **sweep_axes).Run(pf)
+    df = pd.read_csv(pf)
+
+    expected = []
+    for d_roll in sweep_axes['diam_roll']:
+        for d_core in sweep_axes['diam_core']:
+            for cal in sweep_axes['caliper']:
+                length = RollLength(diam_roll=d_roll, diam_core=d_core,
+                                    caliper=cal).CalculateLength
+                if length > 0: expected.append(length)
+    assert stats['n_grid'] == 57 * 2 * 11
+    assert stats['n_rows'] == len(df) == len(expected)
+    assert np.allclose(df['length'], expected)
+    assert stats['rows_per_sec'] > 0
+
+def test_Run_length_band(sweep_axes, tmp_path):
+    """
+    Band filter keeps only lengths inside it, independent of tile size
+    """
+    pf = str(tmp_path / 'band.csv')
+    sweep = ParameterSweep(tile_size=37, length_min=20., length_max=40.,
+                           **sweep_axes)
+    sweep.Run(pf)
+    df = pd.read_csv(pf)
+    assert df['length'].between(20., 40.).all()
+
+    count = ParameterSweep(length_min=20., length_max=40., **sweep_axes).Run()
+    assert count['n_rows'] == len(df) > 0
+
+def test_Run_unsupported_output(sweep_axes, tmp_path):
+    with pytest.raises(ValueError):
+        ParameterSweep(**sweep_axes).Run(str(tmp_path / 'sweep.txt'))